@@ -19,6 +19,27 @@ from src.utils.platform import (
     get_binaries_dir, ensure_directory
 )
 
+# 流式下载的分块大小（1MB），减少 Python 层循环和 write 调用次数
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _preallocate_file(f, size: int) -> None:
+    """
+    为文件预分配空间，避免写入过程中逐块扩展文件
+    
+    Args:
+        f: 以写模式打开的文件对象
+        size: 预分配大小（字节）
+    """
+    try:
+        if hasattr(os, 'posix_fallocate'):
+            os.posix_fallocate(f.fileno(), 0, size)
+        else:
+            f.truncate(size)
+    except OSError:
+        # 预分配只是优化，失败时按普通方式写入
+        pass
+
 
 class VersionManager:
     """版本管理类"""
@@ -89,6 +110,61 @@ class VersionManager:
         
         return session
     
+    def _download_file(self, session: requests.Session, url: str, dest_path: str,
+                       timeout: Tuple[int, int], progress_fn=None) -> int:
+        """
+        流式下载文件到指定路径
+        
+        先写入同目录下的临时文件，下载完整后再替换到目标路径；
+        下载中断时删除临时文件，目标路径不会留下不完整的文件。
+        
+        Args:
+            session: 下载会话
+            url: 下载URL
+            dest_path: 目标文件路径
+            timeout: (连接超时, 读取超时)
+            progress_fn: 进度函数，参数为 (已下载字节数, 总字节数)
+            
+        Returns:
+            已下载的字节数
+        """
+        response = session.get(url, stream=True, timeout=timeout)
+        response.raise_for_status()
+        
+        total_size = int(response.headers.get('content-length', 0))
+        downloaded = 0
+        temp_path = f"{dest_path}.part"
+        
+        try:
+            with response, open(temp_path, 'wb') as f:
+                if total_size > 0:
+                    _preallocate_file(f, total_size)
+                
+                try:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        if chunk:
+                            f.write(chunk)
+                            downloaded += len(chunk)
+                            
+                            if progress_fn and total_size > 0:
+                                progress_fn(downloaded, total_size)
+                finally:
+                    # 无论下载成功还是中断，实际大小与 Content-Length 不符时
+                    # （如压缩传输或连接断开）都截掉未写入的预分配空间
+                    if downloaded < total_size:
+                        f.truncate(downloaded)
+            
+            os.replace(temp_path, dest_path)
+        except BaseException:
+            # 下载失败或被中断：删除未完成的临时文件
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        
+        return downloaded
+    
     def check_and_download_binaries(self, progress_callback=None) -> Tuple[bool, str]:
         """
         检查并下载必要的二进制文件
@@ -132,11 +208,7 @@ class VersionManager:
                 if progress_callback:
                     progress_callback(0, "正在下载 yt-dlp...")
                 
-                response = session.get(download_url, timeout=(30, 300))
-                response.raise_for_status()
-                
-                with open(self.yt_dlp_path, 'wb') as f:
-                    f.write(response.content)
+                self._download_file(session, download_url, self.yt_dlp_path, (30, 300))
                 
                 self.logger.info("yt-dlp 下载完成")
                 
@@ -505,27 +577,16 @@ class VersionManager:
             os.close(fd)
             self.logger.info(f"创建临时文件: {temp_file}")
             
+            def on_progress(downloaded: int, total_size: int):
+                self.update_progress = int(downloaded / total_size * 100)
+                self.update_status = f"正在下载 yt-dlp... {self.update_progress}%"
+                
+                if progress_callback:
+                    progress_callback(self.update_progress, self.update_status)
+            
             # 下载文件 - 使用重试机制和超时
             session = self._create_download_session()
-            response = session.get(download_url, stream=True, timeout=(30, 300))
-            response.raise_for_status()
-            
-            total_size = int(response.headers.get('content-length', 0))
-            block_size = 8192
-            downloaded = 0
-            
-            with open(temp_file, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=block_size):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        if total_size > 0:
-                            self.update_progress = int(downloaded / total_size * 100)
-                            self.update_status = f"正在下载 yt-dlp... {self.update_progress}%"
-                            
-                            if progress_callback:
-                                progress_callback(self.update_progress, self.update_status)
+            self._download_file(session, download_url, temp_file, (30, 300), on_progress)
             
             self.logger.info("yt-dlp 下载完成")
             
@@ -607,27 +668,16 @@ class VersionManager:
             zip_file = os.path.join(temp_dir, 'ffmpeg.zip')
             self.logger.info(f"创建临时目录: {temp_dir}")
             
-            # 下载文件 - 使用重试机制和超时
-            session = self._create_download_session()
-            response = session.get(download_url, stream=True, timeout=(30, 600))  # ffmpeg 文件较大，超时设长一些
-            response.raise_for_status()
+            def on_progress(downloaded: int, total_size: int):
+                self.update_progress = int(downloaded / total_size * 50)  # 下载占50%进度
+                self.update_status = f"正在下载 ffmpeg... {self.update_progress}%"
+                
+                if progress_callback:
+                    progress_callback(self.update_progress, self.update_status)
             
-            total_size = int(response.headers.get('content-length', 0))
-            block_size = 8192
-            downloaded = 0
-            
-            with open(zip_file, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=block_size):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        if total_size > 0:
-                            self.update_progress = int(downloaded / total_size * 50)  # 下载占50%进度
-                            self.update_status = f"正在下载 ffmpeg... {self.update_progress}%"
-                            
-                            if progress_callback:
-                                progress_callback(self.update_progress, self.update_status)
+            # 下载文件 - 使用重试机制和超时（ffmpeg 文件较大，超时设长一些）
+            session = self._create_download_session()
+            self._download_file(session, download_url, zip_file, (30, 600), on_progress)
             
             self.logger.info("ffmpeg 下载完成")
             
@@ -647,11 +647,12 @@ class DownloadTab(QWidget):
         self.progress_bar.setValue(0)
         self.progress_bar.setFormat("%p%")  # 重置进度条格式
         
-        # 使用 ErrorMessages 格式化错误消息
-        formatted_message = ErrorMessages.get_user_message(error_message, include_suggestion=True)
+        # 使用 ErrorMessages 对错误消息分类并格式化
+        classified = ErrorMessages.classify(error_message)
+        formatted_message = classified.format(include_suggestion=True)
         
         # 检测是否需要 cookies
-        needs_cookie = ErrorMessages.needs_cookie(error_message)
+        needs_cookie = classified.needs_cookie
         use_cookies = self.use_cookie_checkbox.isChecked()
         has_cookie_available = self.cookie_tab and self.cookie_tab.is_cookie_available()
         
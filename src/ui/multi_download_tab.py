@@ -1045,11 +1045,13 @@ class MultiDownloadTab(QWidget):
     
     def _on_task_failed(self, task_id: str, error_message: str):
         """任务失败"""
+        classified = ErrorMessages.classify(error_message)
+        
         if task_id in self._tasks:
             task = self._tasks[task_id]
             task.status = DownloadStatus.FAILED
             # 使用 ErrorMessages 格式化错误消息
-            formatted_message = ErrorMessages.get_user_message(error_message, include_suggestion=True)
+            formatted_message = classified.format(include_suggestion=True)
             task.error_message = formatted_message
             task.speed = ""
             task.eta = ""
@@ -1064,7 +1066,7 @@ class MultiDownloadTab(QWidget):
         self.logger.error(f"任务失败: {task_id} - {error_message}")
         
         # 检测是否需要 cookies，如果需要且未启用，显示提示
-        needs_cookie = ErrorMessages.needs_cookie(error_message)
+        needs_cookie = classified.needs_cookie
         use_cookies = self.use_cookie_checkbox.isChecked()
         has_cookie_available = self.cookie_tab and self.cookie_tab.is_cookie_available()
         
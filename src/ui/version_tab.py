@@ -6,6 +6,7 @@ import os
 import sys
 import threading
 import time
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List, Dict, Tuple
 
@@ -15,7 +16,7 @@ from PyQt5.QtWidgets import (
     QGroupBox, QMessageBox, QApplication, QStatusBar, QFrame, QTextEdit,
     QGridLayout, QScrollArea, QSplitter
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize, QTimer
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize, QTimer, QMetaObject, Q_ARG
 from PyQt5.QtGui import QIcon, QFont, QColor, QPalette
 
 # 导入自定义模块
@@ -24,6 +25,61 @@ from src.utils.logger import LoggerManager
 from src.utils.config import ConfigManager
 
 
+# 模块级日志记录器，所有标签页实例共享
+_LOGGER = LoggerManager().get_logger()
+
+# 窗口图标缓存，避免每次创建标签页都重新解码 .ico 文件
+_ICON_CACHE: Optional[QIcon] = None
+
+
+def _get_app_icon(icon_path: str) -> QIcon:
+    """
+    获取应用图标（首次调用时加载，之后复用同一 QIcon 实例）
+    
+    Args:
+        icon_path: 图标文件路径
+        
+    Returns:
+        应用图标
+    """
+    global _ICON_CACHE
+    if _ICON_CACHE is None:
+        _ICON_CACHE = QIcon(icon_path)
+    return _ICON_CACHE
+
+
+@dataclass(frozen=True)
+class ComponentVersionInfo:
+    """单个组件的版本检查结果"""
+    success: bool
+    current_version: str
+    has_update: bool
+    latest_version: str
+    download_url: str
+    release_notes: str
+    file_size: str
+    install_path: str
+
+
+@dataclass(frozen=True)
+class ComponentWidgets:
+    """单个组件版本信息区域中需要随检查结果更新的控件"""
+    status_icon: QLabel
+    current_version_label: QLabel
+    latest_version_label: QLabel
+    file_size_label: QLabel
+    install_path_label: QLabel
+    update_button: QPushButton
+    status_label: QLabel
+
+
+@dataclass(frozen=True)
+class VersionCheckResult:
+    """版本检查结果"""
+    yt_dlp: ComponentVersionInfo
+    ffmpeg: ComponentVersionInfo
+
+
 class UpdateWorker(QThread):
     """更新工作线程类"""
     
@@ -76,8 +132,8 @@ class UpdateWorker(QThread):
 class VersionCheckThread(QThread):
     """版本检查线程类"""
     
-    # 定义信号 - 增加 release notes 和文件大小信息
-    check_completed = pyqtSignal(dict)  # 使用字典传递所有信息
+    # 定义信号 - 以单个 VersionCheckResult 对象传递所有信息
+    check_completed = pyqtSignal(object)
     check_error = pyqtSignal(str)
     progress_updated = pyqtSignal(str)
     
@@ -94,8 +150,6 @@ class VersionCheckThread(QThread):
     def run(self):
         """执行版本检查任务"""
         try:
-            result = {}
-            
             # 发送进度信号
             self.progress_updated.emit("正在检查 yt-dlp 版本...")
             
@@ -107,16 +161,16 @@ class VersionCheckThread(QThread):
             yt_dlp_release_notes = self.version_manager.get_yt_dlp_release_notes()
             yt_dlp_file_size = self.version_manager.get_yt_dlp_file_size()
             
-            result['yt_dlp'] = {
-                'success': yt_dlp_success,
-                'current_version': yt_dlp_current_version,
-                'has_update': yt_dlp_has_update,
-                'latest_version': yt_dlp_latest_version,
-                'download_url': yt_dlp_download_url,
-                'release_notes': yt_dlp_release_notes,
-                'file_size': yt_dlp_file_size,
-                'install_path': self.version_manager.yt_dlp_path
-            }
+            yt_dlp_info = ComponentVersionInfo(
+                success=yt_dlp_success,
+                current_version=yt_dlp_current_version,
+                has_update=yt_dlp_has_update,
+                latest_version=yt_dlp_latest_version,
+                download_url=yt_dlp_download_url,
+                release_notes=yt_dlp_release_notes,
+                file_size=yt_dlp_file_size,
+                install_path=self.version_manager.yt_dlp_path
+            )
             
             # 发送进度信号
             self.progress_updated.emit("正在检查 ffmpeg 版本...")
@@ -133,19 +187,19 @@ class VersionCheckThread(QThread):
             if ffmpeg_latest_version == "last":
                 ffmpeg_latest_version = "最新版本"
             
-            result['ffmpeg'] = {
-                'success': ffmpeg_success,
-                'current_version': ffmpeg_current_version,
-                'has_update': ffmpeg_has_update,
-                'latest_version': ffmpeg_latest_version,
-                'download_url': ffmpeg_download_url,
-                'release_notes': ffmpeg_release_notes,
-                'file_size': ffmpeg_file_size,
-                'install_path': self.version_manager.ffmpeg_dir
-            }
+            ffmpeg_info = ComponentVersionInfo(
+                success=ffmpeg_success,
+                current_version=ffmpeg_current_version,
+                has_update=ffmpeg_has_update,
+                latest_version=ffmpeg_latest_version,
+                download_url=ffmpeg_download_url,
+                release_notes=ffmpeg_release_notes,
+                file_size=ffmpeg_file_size,
+                install_path=self.version_manager.ffmpeg_dir
+            )
             
             # 发送信号
-            self.check_completed.emit(result)
+            self.check_completed.emit(VersionCheckResult(yt_dlp=yt_dlp_info, ffmpeg=ffmpeg_info))
         except Exception as e:
             self.check_error.emit(str(e))
 
@@ -162,6 +216,9 @@ class VersionTab(QWidget):
         'error': ('⚠', '#dc3545')        # 红色 - 错误
     }
     
+    # 状态栏消息最小刷新间隔（秒），进度回调频繁时合并消息
+    STATUS_MESSAGE_INTERVAL = 0.1
+    
     def __init__(self, status_bar: QStatusBar = None, auto_check: bool = True):
         """
         初始化版本标签页
@@ -173,7 +230,7 @@ class VersionTab(QWidget):
         super().__init__()
         
         # 初始化日志
-        self.logger = LoggerManager().get_logger()
+        self.logger = _LOGGER
         self.status_bar = status_bar
         
         # 初始化配置管理器
@@ -188,6 +245,7 @@ class VersionTab(QWidget):
         self.yt_dlp_update_worker = None
         self.ffmpeg_update_worker = None
         self.version_check_thread = None
+        self.init_worker = None
         
         # 版本信息
         self.yt_dlp_current_version = ""
@@ -201,6 +259,14 @@ class VersionTab(QWidget):
         self.yt_dlp_release_notes = ""
         self.ffmpeg_release_notes = ""
         
+        # 状态栏消息合并
+        self._pending_status_message = ""
+        self._last_status_time = 0.0
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(int(self.STATUS_MESSAGE_INTERVAL * 1000))
+        self._status_timer.timeout.connect(self._flush_status_message)
+        
         # 初始化 UI
         self.init_ui()
         
@@ -220,7 +286,7 @@ class VersionTab(QWidget):
 
         # 设置窗口图标
         if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+            self.setWindowIcon(_get_app_icon(icon_path))
     
     def init_ui(self):
         """初始化 UI"""
@@ -280,6 +346,22 @@ class VersionTab(QWidget):
         
         # 添加弹性空间
         main_layout.addStretch()
+        
+        # 各组件随版本检查结果更新的控件（控件创建后只构建一次）
+        self._component_widgets: Dict[str, ComponentWidgets] = {
+            'yt_dlp': ComponentWidgets(
+                self.yt_dlp_status_icon, self.yt_dlp_current_version_label,
+                self.yt_dlp_latest_version_label, self.yt_dlp_file_size_label,
+                self.yt_dlp_install_path_label, self.yt_dlp_update_button,
+                self.yt_dlp_status_label
+            ),
+            'ffmpeg': ComponentWidgets(
+                self.ffmpeg_status_icon, self.ffmpeg_current_version_label,
+                self.ffmpeg_latest_version_label, self.ffmpeg_file_size_label,
+                self.ffmpeg_install_path_label, self.ffmpeg_update_button,
+                self.ffmpeg_status_label
+            ),
+        }
     
     def _create_component_group(self, name: str, description: str) -> QGroupBox:
         """创建组件版本信息组"""
@@ -681,15 +763,31 @@ class VersionTab(QWidget):
         self._update_last_check_label()
     
     def update_status_message(self, message):
-        """更新状态栏消息"""
-        if self.status_bar:
-            # 使用 QTimer.singleShot 确保在主线程中更新 UI
-            QTimer.singleShot(0, lambda: self.status_bar.showMessage(message))
+        """更新状态栏消息（100ms 内的多次更新只显示最后一条）"""
+        if not self.status_bar:
+            return
+        
+        self._pending_status_message = message
+        
+        if time.monotonic() - self._last_status_time >= self.STATUS_MESSAGE_INTERVAL:
+            self._flush_status_message()
+        elif not self._status_timer.isActive():
+            self._status_timer.start()
+    
+    def _flush_status_message(self):
+        """将待显示的消息投递到状态栏"""
+        self._last_status_time = time.monotonic()
+        
+        # 通过排队调用确保在主线程中更新 UI
+        QMetaObject.invokeMethod(
+            self.status_bar, "showMessage", Qt.QueuedConnection,
+            Q_ARG(str, self._pending_status_message)
+        )
     
     def check_versions(self):
         """检查版本"""
         # 如果已经在检查中，直接返回
-        if hasattr(self, 'version_check_thread') and self.version_check_thread and self.version_check_thread.isRunning():
+        if self.version_check_thread and self.version_check_thread.isRunning():
             return
             
         # 禁用检查更新按钮
@@ -717,108 +815,30 @@ class VersionTab(QWidget):
         self.version_check_thread.progress_updated.connect(self.update_status_message)
         self.version_check_thread.start()
     
-    def on_version_check_completed(self, result: dict):
+    def on_version_check_completed(self, result: VersionCheckResult):
         """版本检查完成回调"""
         # 保存检查时间
         self._save_check_time()
         
-        # 获取 yt-dlp 信息
-        yt_dlp_info = result.get('yt_dlp', {})
-        yt_dlp_success = yt_dlp_info.get('success', False)
-        yt_dlp_current_version = yt_dlp_info.get('current_version', '')
-        yt_dlp_has_update = yt_dlp_info.get('has_update', False)
-        yt_dlp_latest_version = yt_dlp_info.get('latest_version', '')
-        yt_dlp_download_url = yt_dlp_info.get('download_url', '')
-        yt_dlp_release_notes = yt_dlp_info.get('release_notes', '')
-        yt_dlp_file_size = yt_dlp_info.get('file_size', '--')
-        yt_dlp_install_path = yt_dlp_info.get('install_path', '--')
-        
-        # 更新 yt-dlp 版本信息
-        if yt_dlp_success:
-            self.yt_dlp_current_version = yt_dlp_current_version
-            self.yt_dlp_current_version_label.setText(yt_dlp_current_version)
-        else:
-            self.yt_dlp_current_version_label.setText("未安装")
-        
-        if yt_dlp_latest_version:
-            self.yt_dlp_latest_version = yt_dlp_latest_version
-            self.yt_dlp_latest_version_label.setText(yt_dlp_latest_version)
-        else:
-            self.yt_dlp_latest_version_label.setText("无法获取")
-        
-        # 更新 yt-dlp 附加信息
-        self.yt_dlp_file_size_label.setText(yt_dlp_file_size)
-        self.yt_dlp_install_path_label.setText(yt_dlp_install_path)
-        self.yt_dlp_release_notes = yt_dlp_release_notes
-        
-        # 保存下载链接
-        self.yt_dlp_download_url = yt_dlp_download_url
-        
-        # 判断yt-dlp按钮状态和图标
-        if not yt_dlp_success:
-            self.yt_dlp_update_button.setText("下载")
-            self.yt_dlp_update_button.setEnabled(True)
-            self.yt_dlp_status_label.setText("❌ 未安装，需下载")
-            self._update_status_icon(self.yt_dlp_status_icon, 'not_installed')
-        elif yt_dlp_has_update and yt_dlp_download_url:
-            self.yt_dlp_update_button.setText("更新")
-            self.yt_dlp_update_button.setEnabled(True)
-            self.yt_dlp_status_label.setText("⬆ 有新版本可用")
-            self._update_status_icon(self.yt_dlp_status_icon, 'update')
-        else:
-            self.yt_dlp_update_button.setText("更新")
-            self.yt_dlp_update_button.setEnabled(False)
-            self.yt_dlp_status_label.setText("✓ 已是最新版本")
-            self._update_status_icon(self.yt_dlp_status_icon, 'latest')
-        
-        # 获取 ffmpeg 信息
-        ffmpeg_info = result.get('ffmpeg', {})
-        ffmpeg_success = ffmpeg_info.get('success', False)
-        ffmpeg_current_version = ffmpeg_info.get('current_version', '')
-        ffmpeg_has_update = ffmpeg_info.get('has_update', False)
-        ffmpeg_latest_version = ffmpeg_info.get('latest_version', '')
-        ffmpeg_download_url = ffmpeg_info.get('download_url', '')
-        ffmpeg_release_notes = ffmpeg_info.get('release_notes', '')
-        ffmpeg_file_size = ffmpeg_info.get('file_size', '--')
-        ffmpeg_install_path = ffmpeg_info.get('install_path', '--')
-        
-        # 更新 ffmpeg 版本信息
-        if ffmpeg_success:
-            self.ffmpeg_current_version = ffmpeg_current_version
-            self.ffmpeg_current_version_label.setText(ffmpeg_current_version)
-        else:
-            self.ffmpeg_current_version_label.setText("未安装")
-        
-        if ffmpeg_latest_version:
-            self.ffmpeg_latest_version = ffmpeg_latest_version
-            self.ffmpeg_latest_version_label.setText(ffmpeg_latest_version)
-        else:
-            self.ffmpeg_latest_version_label.setText("无法获取")
-        
-        # 更新 ffmpeg 附加信息
-        self.ffmpeg_file_size_label.setText(ffmpeg_file_size)
-        self.ffmpeg_install_path_label.setText(ffmpeg_install_path)
-        self.ffmpeg_release_notes = ffmpeg_release_notes
-        
-        # 保存下载链接
-        self.ffmpeg_download_url = ffmpeg_download_url
-        
-        # 判断ffmpeg按钮状态和图标
-        if not ffmpeg_success:
-            self.ffmpeg_update_button.setText("下载")
-            self.ffmpeg_update_button.setEnabled(True)
-            self.ffmpeg_status_label.setText("❌ 未安装，需下载")
-            self._update_status_icon(self.ffmpeg_status_icon, 'not_installed')
-        elif ffmpeg_has_update and ffmpeg_download_url:
-            self.ffmpeg_update_button.setText("更新")
-            self.ffmpeg_update_button.setEnabled(True)
-            self.ffmpeg_status_label.setText("⬆ 有新版本可用")
-            self._update_status_icon(self.ffmpeg_status_icon, 'update')
-        else:
-            self.ffmpeg_update_button.setText("更新")
-            self.ffmpeg_update_button.setEnabled(False)
-            self.ffmpeg_status_label.setText("✓ 已是最新版本")
-            self._update_status_icon(self.ffmpeg_status_icon, 'latest')
+        # 更新各组件的控件
+        self._apply_version_status('yt_dlp', result.yt_dlp)
+        self._apply_version_status('ffmpeg', result.ffmpeg)
+        
+        # 保存版本信息、更新日志和下载链接
+        yt_dlp, ffmpeg = result.yt_dlp, result.ffmpeg
+        if yt_dlp.success:
+            self.yt_dlp_current_version = yt_dlp.current_version
+        if yt_dlp.latest_version:
+            self.yt_dlp_latest_version = yt_dlp.latest_version
+        self.yt_dlp_release_notes = yt_dlp.release_notes
+        self.yt_dlp_download_url = yt_dlp.download_url
+        
+        if ffmpeg.success:
+            self.ffmpeg_current_version = ffmpeg.current_version
+        if ffmpeg.latest_version:
+            self.ffmpeg_latest_version = ffmpeg.latest_version
+        self.ffmpeg_release_notes = ffmpeg.release_notes
+        self.ffmpeg_download_url = ffmpeg.download_url
         
         # 更新 Release Notes 显示
         if self.yt_dlp_notes_btn.isChecked():
@@ -832,6 +852,42 @@ class VersionTab(QWidget):
         # 更新状态栏
         self.update_status_message("版本检查完成")
     
+    def _apply_version_status(self, component: str, info: ComponentVersionInfo):
+        """
+        将组件的版本检查结果应用到对应的控件
+        
+        Args:
+            component: 组件标识，'yt_dlp' 或 'ffmpeg'
+            info: 组件版本检查结果
+        """
+        widgets = self._component_widgets[component]
+        
+        # 更新版本信息
+        widgets.current_version_label.setText(info.current_version if info.success else "未安装")
+        widgets.latest_version_label.setText(info.latest_version or "无法获取")
+        
+        # 更新附加信息
+        widgets.file_size_label.setText(info.file_size)
+        widgets.install_path_label.setText(info.install_path)
+        
+        # 判断按钮状态和图标
+        update_button = widgets.update_button
+        if not info.success:
+            update_button.setText("下载")
+            update_button.setEnabled(True)
+            widgets.status_label.setText("❌ 未安装，需下载")
+            self._update_status_icon(widgets.status_icon, 'not_installed')
+        elif info.has_update and info.download_url:
+            update_button.setText("更新")
+            update_button.setEnabled(True)
+            widgets.status_label.setText("⬆ 有新版本可用")
+            self._update_status_icon(widgets.status_icon, 'update')
+        else:
+            update_button.setText("更新")
+            update_button.setEnabled(False)
+            widgets.status_label.setText("✓ 已是最新版本")
+            self._update_status_icon(widgets.status_icon, 'latest')
+    
     def on_version_check_error(self, error_message):
         """版本检查错误回调"""
         QMessageBox.critical(self, "错误", f"检查版本时发生错误: {error_message}")
@@ -1050,6 +1106,10 @@ class VersionTab(QWidget):
 
     def init_binaries(self):
         """初始化下载必要的二进制文件"""
+        # 如果已经在初始化中，直接返回
+        if self.init_worker and self.init_worker.isRunning():
+            return
+        
         # 更新状态图标
         self._update_status_icon(self.yt_dlp_status_icon, 'checking')
         self._update_status_icon(self.ffmpeg_status_icon, 'checking')
@@ -3,6 +3,7 @@ YouTube Downloader 的配置管理模块
 负责处理应用程序配置和设置
 """
 import os
+import gzip
 import json
 import sys
 from typing import Dict, Any, Optional
@@ -25,6 +26,9 @@ class ConfigManager:
         # 设置配置文件路径
         self.config_file = config_file or os.path.join(app_data_dir, 'config.json')
         
+        # 压缩后的配置文件路径（优先读写）
+        self.compressed_config_file = self.config_file + '.gz'
+        
         # 默认配置
         self.default_config = {
             'download_dir': os.path.join(os.path.expanduser('~'), 'Downloads'),
@@ -56,10 +60,15 @@ class ConfigManager:
         Returns:
             配置字典
         """
-        if os.path.exists(self.config_file):
+        if os.path.exists(self.compressed_config_file) or os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                # 优先读取压缩配置，兼容旧版本的纯 JSON 配置
+                if os.path.exists(self.compressed_config_file):
+                    with open(self.compressed_config_file, 'rb') as f:
+                        config = json.loads(gzip.decompress(f.read()).decode('utf-8'))
+                else:
+                    with open(self.config_file, 'r', encoding='utf-8') as f:
+                        config = json.load(f)
                 
                 # 合并默认配置和加载的配置
                 merged_config = self.default_config.copy()
@@ -78,9 +87,19 @@ class ConfigManager:
         Returns:
             是否成功保存
         """
+        temp_file = self.compressed_config_file + '.tmp'
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=2)
+            data = json.dumps(self.config, ensure_ascii=False).encode('utf-8')
+            # 先写入临时文件再替换，写入中断时不会损坏已有配置
+            with open(temp_file, 'wb') as f:
+                f.write(gzip.compress(data, compresslevel=1))
+            os.replace(temp_file, self.compressed_config_file)
+            
+            # 删除旧版本的纯 JSON 配置，避免其中的旧数据（如代理密码）继续留在磁盘上
+            try:
+                os.remove(self.config_file)
+            except FileNotFoundError:
+                pass
             return True
         except Exception as e:
             print(f"保存配置文件時發生錯誤: {str(e)}")
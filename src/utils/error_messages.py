@@ -2,16 +2,93 @@
 YouTube Downloader 用户友好错误提示模块
 将技术性错误消息转换为用户可理解的提示
 """
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 import re
 
 from src.core.exceptions import (
-    YouTubeDownloaderError, VideoParseError, VideoUnavailableError,
-    VideoPrivateError, VideoAgeRestrictedError, VideoLiveError,
-    DownloadError, NetworkError, CookieError, BinaryError
+    VideoParseError, VideoUnavailableError, VideoPrivateError,
+    VideoAgeRestrictedError, VideoLiveError, DownloadError,
+    NetworkError, CookieError, BinaryError
 )
 
 
+# 错误消息转换结果的缓存条目数（重试、批量下载时常出现相同的错误消息）
+_MESSAGE_CACHE_SIZE = 256
+
+# 实际使用中最常见的错误模式（小写），在合并正则中排在最前面优先尝试
+_COMMON_PATTERNS: Tuple[str, ...] = (
+    "sign in to confirm you're not a bot",
+    'http error 429',
+    'video unavailable',
+    'unable to extract',
+    'no space left',
+)
+
+# 建议类别的匹配规则（按优先级排列）：(关键词, 建议类别)
+_SUGGESTION_RULES: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (('private', 'age', 'sign in', 'members'), 'cookie'),
+    (('connection', 'network', 'ssl', 'certificate', 'http'), 'network'),
+    (('format', 'extract'), 'format'),
+    (('permission', 'access'), 'permission'),
+    (('space', 'quota'), 'space'),
+    (('yt-dlp', 'ffmpeg'), 'update'),
+    (('javascript runtime', 'no supported'), 'javascript'),
+)
+
+# 可通过重试解决的错误关键词
+_RECOVERABLE_PATTERNS: Tuple[str, ...] = (
+    'connection', 'timeout', 'network', 'http error 5',
+    'temporarily', 'try again', 'rate limit'
+)
+
+# 需要设置 Cookie 的错误关键词
+_COOKIE_PATTERNS: Tuple[str, ...] = (
+    'private', 'age', 'sign in', 'login', 'members',
+    'confirm your age', 'age restricted', 'authentication',
+    "confirm you're not a bot", 'not a bot', 'bot'
+)
+
+# 以上关键词各自合并成的正则，一次扫描即可判断是否命中
+_RECOVERABLE_RE = re.compile('|'.join(map(re.escape, _RECOVERABLE_PATTERNS)))
+_COOKIE_RE = re.compile('|'.join(map(re.escape, _COOKIE_PATTERNS)))
+
+
+def _suggestion_key(pattern_lower: str) -> str:
+    """根据错误模式（已转为小写）确定建议类别"""
+    for words, key in _SUGGESTION_RULES:
+        if any(word in pattern_lower for word in words):
+            return key
+    return 'retry'
+
+
+@dataclass(frozen=True)
+class ClassifiedError:
+    """错误消息的分类结果"""
+    title: str              # 错误标题
+    message: str            # 用户友好的错误说明
+    suggestion: str         # 建议操作
+    recoverable: bool       # 是否可通过重试解决
+    needs_cookie: bool      # 是否需要设置 Cookie
+    matched: bool           # 是否命中已知错误模式
+    
+    def format(self, include_suggestion: bool = True) -> str:
+        """
+        格式化为展示给用户的消息
+        
+        Args:
+            include_suggestion: 是否包含建议（未知错误始终包含）
+            
+        Returns:
+            用户友好的错误消息
+        """
+        result = f"{self.title}\n\n{self.message}"
+        if include_suggestion or not self.matched:
+            result += f"\n\n💡 建议：{self.suggestion}"
+        return result
+
+
 class ErrorMessages:
     """错误消息管理器"""
     
@@ -164,6 +241,34 @@ class ErrorMessages:
         ),
     }
     
+    # 预先转为小写的错误模式 (pattern_lower, title, message)，按 ERROR_PATTERNS 的顺序排列
+    _PATTERNS_LOWER: Tuple[Tuple[str, str, str], ...] = tuple(
+        (pattern.lower(), title, message)
+        for pattern, (title, message) in ERROR_PATTERNS.items()
+    )
+    
+    # 模式到优先级（在 _PATTERNS_LOWER 中的位置）的映射
+    _PATTERN_INDEX: Dict[str, int] = {
+        pattern_lower: index for index, (pattern_lower, _, _) in enumerate(_PATTERNS_LOWER)
+    }
+    
+    # 合并正则中优先尝试的分支：只取 _COMMON_PATTERNS 中确实存在的模式，
+    # 某个常见模式被改名或删除时只是不再优先尝试，不会产生查不到优先级的分支
+    _LEADING_PATTERNS: Tuple[str, ...] = tuple(filter(_PATTERN_INDEX.__contains__, _COMMON_PATTERNS))
+    
+    # 所有错误模式合并成的单个正则（零宽前瞻以捕获重叠的命中），一次扫描找出全部命中模式。
+    # 没有任何模式是另一个模式的前缀（由测试保证），所以分支顺序不影响结果，只影响每个位置的尝试顺序；
+    # 命中多个模式时仍按 _PATTERNS_LOWER 中的优先级取舍。
+    _PATTERN_RE = re.compile(
+        '(?=(' + '|'.join(
+            re.escape(pattern_lower)
+            for pattern_lower in _LEADING_PATTERNS + tuple(
+                pattern_lower for pattern_lower in _PATTERN_INDEX
+                if pattern_lower not in _COMMON_PATTERNS
+            )
+        ) + '))'
+    )
+    
     # 建议操作
     SUGGESTIONS: Dict[str, str] = {
         'cookie': '请在"Cookie"页面设置您的浏览器 Cookie。',
@@ -173,68 +278,104 @@ class ErrorMessages:
         'format': '请尝试选择其他视频格式。',
         'permission': '请检查目录权限或选择其他保存位置。',
         'space': '请清理磁盘空间后重试。',
+        'javascript': '请安装 Node.js 或 Deno JavaScript 运行时。',
+        'unknown': '如果问题持续，请尝试更新下载工具或检查网络连接。',
+    }
+    
+    # 异常类型到用户友好消息的映射
+    _EXCEPTION_MESSAGES: Dict[type, str] = {
+        VideoUnavailableError: "视频不可用\n\n该视频可能已被删除、设为私密或在您所在的地区不可用。",
+        VideoPrivateError: "私人视频\n\n这是一个私人视频，需要登录才能访问。请设置 Cookie 后重试。",
+        VideoAgeRestrictedError: "年龄限制\n\n此视频有年龄限制，请设置 Cookie 后重试。",
+        VideoLiveError: "直播视频\n\n无法下载正在进行的直播。请等待直播结束后重试。",
+        NetworkError: "网络错误\n\n请检查您的网络连接后重试。",
+        CookieError: "Cookie 错误\n\n请检查 Cookie 设置是否正确。",
+        BinaryError: "工具错误\n\n下载工具出现问题。请在\"版本\"页面更新工具。",
+    }
+    
+    # 错误模式（已转为小写）到建议类别的映射，类定义时一次性计算
+    _PATTERN_SUGGESTION: Dict[str, str] = {
+        pattern_lower: _suggestion_key(pattern_lower) for pattern_lower, _, _ in _PATTERNS_LOWER
     }
     
     @classmethod
-    def get_user_message(cls, error: str, include_suggestion: bool = True) -> str:
+    @lru_cache(maxsize=_MESSAGE_CACHE_SIZE)
+    def classify(cls, error: str) -> ClassifiedError:
         """
-        获取用户友好的错误消息
+        对错误消息进行分类（只转换一次小写，一次得到标题、说明、建议等全部信息）
         
         Args:
             error: 原始错误消息
-            include_suggestion: 是否包含建议
             
         Returns:
-            用户友好的错误消息
+            错误分类结果
         """
         error_lower = error.lower()
+        recoverable = _RECOVERABLE_RE.search(error_lower) is not None
+        needs_cookie = _COOKIE_RE.search(error_lower) is not None
         
-        for pattern, (title, message) in cls.ERROR_PATTERNS.items():
-            if pattern.lower() in error_lower:
-                result = f"{title}\n\n{message}"
-                
-                if include_suggestion:
-                    suggestion = cls._get_suggestion(pattern)
-                    if suggestion:
-                        result += f"\n\n💡 建议：{suggestion}"
-                
-                return result
+        matched = cls._match_pattern(error_lower)
+        if matched:
+            pattern_lower, title, message = matched
+            return ClassifiedError(
+                title=title,
+                message=message,
+                suggestion=cls._get_suggestion(pattern_lower),
+                recoverable=recoverable,
+                needs_cookie=needs_cookie,
+                matched=True
+            )
         
         # 默认消息
-        return f"下载出错\n\n{error}\n\n💡 建议：如果问题持续，请尝试更新下载工具或检查网络连接。"
+        return ClassifiedError(
+            title="下载出错",
+            message=error,
+            suggestion=cls.SUGGESTIONS['unknown'],
+            recoverable=recoverable,
+            needs_cookie=needs_cookie,
+            matched=False
+        )
     
     @classmethod
-    def _get_suggestion(cls, pattern: str) -> str:
-        """根据错误模式获取建议"""
-        pattern_lower = pattern.lower()
+    def get_user_message(cls, error: str, include_suggestion: bool = True) -> str:
+        """
+        获取用户友好的错误消息
+        
+        Args:
+            error: 原始错误消息
+            include_suggestion: 是否包含建议
+            
+        Returns:
+            用户友好的错误消息
+        """
+        return cls.classify(error).format(include_suggestion)
+    
+    @classmethod
+    def _match_pattern(cls, error_lower: str) -> Optional[Tuple[str, str, str]]:
+        """
+        查找错误消息命中的优先级最高的模式
         
-        if any(word in pattern_lower for word in ['private', 'age', 'sign in', 'members']):
-            return cls.SUGGESTIONS['cookie']
-        elif any(word in pattern_lower for word in ['connection', 'network', 'ssl', 'certificate', 'http']):
-            return cls.SUGGESTIONS['network']
-        elif any(word in pattern_lower for word in ['format', 'extract']):
-            return cls.SUGGESTIONS['format']
-        elif any(word in pattern_lower for word in ['permission', 'access']):
-            return cls.SUGGESTIONS['permission']
-        elif any(word in pattern_lower for word in ['space', 'quota']):
-            return cls.SUGGESTIONS['space']
-        elif any(word in pattern_lower for word in ['yt-dlp', 'ffmpeg']):
-            return cls.SUGGESTIONS['update']
-        elif 'javascript runtime' in pattern_lower or 'no supported' in pattern_lower:
-            return '请安装 Node.js 或 Deno JavaScript 运行时。'
-        else:
-            return cls.SUGGESTIONS['retry']
+        Args:
+            error_lower: 已转为小写的错误消息
+            
+        Returns:
+            (pattern_lower, title, message)，未命中时返回 None
+        """
+        index = min(
+            (cls._PATTERN_INDEX[m.group(1)] for m in cls._PATTERN_RE.finditer(error_lower)),
+            default=None
+        )
+        return None if index is None else cls._PATTERNS_LOWER[index]
+    
+    @classmethod
+    def _get_suggestion(cls, pattern_lower: str) -> str:
+        """根据错误模式（已转为小写）获取建议"""
+        return cls.SUGGESTIONS[cls._PATTERN_SUGGESTION.get(pattern_lower, 'retry')]
     
     @classmethod
     def get_error_title(cls, error: str) -> str:
         """获取错误标题"""
-        error_lower = error.lower()
-        
-        for pattern, (title, _) in cls.ERROR_PATTERNS.items():
-            if pattern.lower() in error_lower:
-                return title
-        
-        return "下载出错"
+        return cls.classify(error).title
     
     @classmethod
     def from_exception(cls, exception: Exception) -> str:
@@ -247,24 +388,13 @@ class ErrorMessages:
         Returns:
             用户友好的错误消息
         """
-        if isinstance(exception, VideoUnavailableError):
-            return "视频不可用\n\n该视频可能已被删除、设为私密或在您所在的地区不可用。"
-        elif isinstance(exception, VideoPrivateError):
-            return "私人视频\n\n这是一个私人视频，需要登录才能访问。请设置 Cookie 后重试。"
-        elif isinstance(exception, VideoAgeRestrictedError):
-            return "年龄限制\n\n此视频有年龄限制，请设置 Cookie 后重试。"
-        elif isinstance(exception, VideoLiveError):
-            return "直播视频\n\n无法下载正在进行的直播。请等待直播结束后重试。"
-        elif isinstance(exception, NetworkError):
-            return "网络错误\n\n请检查您的网络连接后重试。"
-        elif isinstance(exception, CookieError):
-            return "Cookie 错误\n\n请检查 Cookie 设置是否正确。"
-        elif isinstance(exception, BinaryError):
-            return "工具错误\n\n下载工具出现问题。请在\"版本\"页面更新工具。"
-        elif isinstance(exception, YouTubeDownloaderError):
-            return cls.get_user_message(str(exception))
-        else:
-            return cls.get_user_message(str(exception))
+        # 沿异常类型的 MRO 查找，最具体的类型优先
+        for exc_type in type(exception).__mro__:
+            message = cls._EXCEPTION_MESSAGES.get(exc_type)
+            if message:
+                return message
+        
+        return cls.get_user_message(str(exception))
     
     @classmethod
     def is_recoverable(cls, error: str) -> bool:
@@ -277,13 +407,7 @@ class ErrorMessages:
         Returns:
             是否可恢复
         """
-        recoverable_patterns = [
-            'connection', 'timeout', 'network', 'http error 5',
-            'temporarily', 'try again', 'rate limit'
-        ]
-        
-        error_lower = error.lower()
-        return any(pattern in error_lower for pattern in recoverable_patterns)
+        return cls.classify(error).recoverable
     
     @classmethod
     def needs_cookie(cls, error: str) -> bool:
@@ -296,14 +420,7 @@ class ErrorMessages:
         Returns:
             是否需要 Cookie
         """
-        cookie_patterns = [
-            'private', 'age', 'sign in', 'login', 'members',
-            'confirm your age', 'age restricted', 'authentication',
-            "confirm you're not a bot", 'not a bot', 'bot'
-        ]
-        
-        error_lower = error.lower()
-        return any(pattern in error_lower for pattern in cookie_patterns)
+        return cls.classify(error).needs_cookie
 
 
 def format_error_for_user(error: str) -> str:
@@ -319,6 +436,19 @@ def format_error_for_user(error: str) -> str:
     return ErrorMessages.get_user_message(error)
 
 
+def classify_error(error: str) -> ClassifiedError:
+    """
+    对错误消息进行分类（便捷函数）
+    
+    Args:
+        error: 原始错误消息
+        
+    Returns:
+        错误分类结果
+    """
+    return ErrorMessages.classify(error)
+
+
 def format_exception_for_user(exception: Exception) -> str:
     """
     格式化异常供用户查看（便捷函数）
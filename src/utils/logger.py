@@ -4,23 +4,185 @@ YouTube Downloader 的日志管理模块
 """
 import os
 import sys
+import time
+import queue
+import atexit
 import logging
 import platform
-import traceback
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import RotatingFileHandler, MemoryHandler, QueueHandler, QueueListener
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict
 
 
+# 日志格式中不使用线程和进程信息，关闭后每条记录不再查询当前线程/进程
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# 文件日志缓冲的记录条数，以及定时写出缓冲的间隔（秒）
+LOG_BUFFER_CAPACITY = 512
+LOG_FLUSH_INTERVAL = 5.0
+
+# 文件大小单位
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+def _processor_name() -> str:
+    """
+    获取处理器名称
+    
+    Windows 上 platform.processor() 需要调用 WMI 查询，较慢，直接读取系统环境变量即可
+    
+    Returns:
+        处理器名称
+    """
+    if sys.platform == 'win32':
+        return os.environ.get('PROCESSOR_IDENTIFIER', '')
+    return platform.processor()
+
+
+def _has_console() -> bool:
+    """
+    判断当前进程是否有可输出的终端
+    
+    Returns:
+        stderr 连接到终端且不是打包后的程序时返回 True
+    """
+    if getattr(sys, 'frozen', False) or sys.stderr is None:
+        return False
+    try:
+        return sys.stderr.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+@lru_cache(maxsize=1)
+def _system_info() -> Dict[str, str]:
+    """
+    收集系统信息（进程生命周期内不变，只收集一次）
+    
+    Returns:
+        系统信息字典
+    """
+    return {
+        '操作系统': platform.platform(),
+        'Python版本': platform.python_version(),
+        '处理器': _processor_name(),
+    }
+
+
+class FastFormatter(logging.Formatter):
+    """
+    按秒缓存时间字符串的日志格式化器
+    
+    同一秒内的日志记录复用已格式化的日期时间，只拼接毫秒部分，避免每条记录都调用 strftime
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (整数秒, 该秒对应的时间字符串)
+        self._time_cache = (None, '')
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, cached_time = self._time_cache
+        if second != cached_second:
+            cached_time = time.strftime(self.default_time_format, self.converter(second))
+            self._time_cache = (second, cached_time)
+        return f"{cached_time},{int(record.msecs):03d}"
+
+
+class CachedSizeRotatingHandler(RotatingFileHandler):
+    """
+    在内存中累计文件大小的滚动文件处理器
+    
+    标准 RotatingFileHandler 判断是否滚动时，每条记录都要额外格式化一次并 seek 日志文件；
+    这里在打开文件时读取一次大小，之后按写入的字节数累加，每条记录只格式化一次。
+    """
+    
+    def _open(self):
+        # newline='' 关闭换行符转换，写入磁盘的字节数与编码后的消息长度一致
+        # （否则 Windows 上每个 \n 会被写成 \r\n，累计的大小偏小）
+        stream = open(self.baseFilename, self.mode, encoding=self.encoding, errors=self.errors, newline='')
+        self._current_size = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            
+            size = len(msg.encode(self.encoding or 'utf-8'))
+            if self.maxBytes > 0 and self._current_size > 0 and self._current_size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            
+            self.stream.write(msg)
+            self.flush()
+            self._current_size += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class MilestoneMemoryHandler(MemoryHandler):
+    """
+    支持按记录立即写出的内存缓冲处理器
+    
+    带有 flush 标记的记录（通过 extra={'flush': True} 传入）会连同之前缓冲的记录
+    一起写入磁盘。写出发生在后台日志线程上，调用线程不会阻塞在磁盘 I/O 上。
+    """
+    
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return getattr(record, 'flush', False) or super().shouldFlush(record)
+
+
+class InProcessQueueHandler(QueueHandler):
+    """
+    不在调用线程上格式化记录的队列处理器
+    
+    标准 QueueHandler.prepare() 会在调用线程上格式化消息和异常堆栈并复制记录，
+    以便记录可以被序列化传给其他进程。这里的队列只在进程内使用，直接把原记录交给后台线程，
+    消息拼接和堆栈格式化都在 QueueListener 线程上进行。
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 class LoggerManager:
     """日志管理类"""
     _instance = None
+    _initialized = False
+    _lock = threading.Lock()
     
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
-            cls._instance = super(LoggerManager, cls).__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(LoggerManager, cls).__new__(cls)
         return cls._instance
     
+    @classmethod
+    def get_instance(cls) -> 'LoggerManager':
+        """
+        获取全局日志管理器实例
+        
+        Returns:
+            日志管理器实例
+        """
+        if cls._initialized:
+            return cls._instance
+        return cls()
+    
     def __init__(self, log_file: str = None, log_level: int = logging.INFO):
         """
         初始化日志管理器
@@ -29,10 +191,24 @@ class LoggerManager:
             log_file: 日志文件路径，如果为 None 则使用默认路径
             log_level: 日志级别
         """
-        # 如果已经初始化过，直接返回
-        if hasattr(self, 'logger'):
+        # 如果已经初始化过，直接返回（各模块重复调用时不会重建处理器）
+        if type(self)._initialized:
             return
-            
+        
+        with type(self)._lock:
+            if type(self)._initialized:
+                return
+            self._setup(log_file, log_level)
+            type(self)._initialized = True
+    
+    def _setup(self, log_file: str, log_level: int) -> None:
+        """
+        创建日志处理器并启动后台写入线程
+        
+        Args:
+            log_file: 日志文件路径，如果为 None 则使用默认路径
+            log_level: 日志级别
+        """
         # 获取应用程序日志目录
         from src.utils.platform import get_logs_dir
         app_data_dir = str(get_logs_dir())
@@ -51,72 +227,106 @@ class LoggerManager:
         if self.logger.handlers:
             self.logger.handlers.clear()
         
-        # 添加文件处理器
-        file_handler = RotatingFileHandler(
+        # 添加文件处理器（延迟到第一条日志写入时才打开文件）
+        file_handler = CachedSizeRotatingHandler(
             self.log_file,
             maxBytes=10*1024*1024,  # 10MB
             backupCount=5,
-            encoding='utf-8'
+            encoding='utf-8',
+            delay=True
         )
         file_handler.setLevel(log_level)
         
-        # 添加控制台处理器
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(log_level)
-        
-        # 设置详细的日志格式
-        detailed_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
+        # 设置详细的日志格式（文件和控制台共用同一个格式化器）
+        detailed_formatter = FastFormatter(
+            '{asctime} - {name} - {levelname} - [{filename}:{lineno}] - {message}',
+            style='{'
         )
         file_handler.setFormatter(detailed_formatter)
-        console_handler.setFormatter(detailed_formatter)
         
-        # 添加处理器到记录器
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # 文件日志先写入内存缓冲，攒满、遇到 WARNING 及以上级别或带 flush 标记的记录时才写入磁盘
+        self._memory_handler = MilestoneMemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY,
+            flushLevel=logging.WARNING,
+            target=file_handler,
+            flushOnClose=True
+        )
+        self._memory_handler.setLevel(log_level)
+        handlers = [self._memory_handler]
+        
+        # 仅在有真实终端时添加控制台处理器，打包后的 GUI 程序不做无用的格式化和输出
+        if _has_console():
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(log_level)
+            console_handler.setFormatter(detailed_formatter)
+            handlers.append(console_handler)
+        
+        # 通过队列把日志交给后台线程写入，调用线程不再阻塞在磁盘 I/O 上
+        self._log_queue = queue.SimpleQueue()
+        self._listener = QueueListener(
+            self._log_queue,
+            *handlers,
+            respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self.close)
+        
+        # 后台线程定时写出缓冲，避免日志长时间停留在内存中
+        self._stop_event = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._periodic_flush,
+            name='LoggerFlush',
+            daemon=True
+        )
+        self._flush_thread.start()
         
-        # 记录系统信息
-        self._log_system_info()
+        # 记录器只挂载队列处理器
+        self.logger.addHandler(InProcessQueueHandler(self._log_queue))
+        
+        # 在后台线程记录系统信息，避免 platform 查询阻塞启动
+        threading.Thread(
+            target=self._log_system_info,
+            name='LoggerSystemInfo',
+            daemon=True
+        ).start()
     
     def _log_system_info(self):
         """记录系统信息"""
         system_info = self._get_system_info()
         
-        # 构建格式化的系统信息字符串
-        formatted_info = "系统信息:\n"
-        formatted_info += f"操作系统: {system_info['操作系统']}\n"
-        formatted_info += f"Python版本: {system_info['Python版本']}\n"
-        formatted_info += f"处理器: {system_info['处理器']}"
-        
-        self.info(formatted_info)
+        self.logger.info(
+            "系统信息:\n操作系统: %s\nPython版本: %s\n处理器: %s",
+            system_info['操作系统'], system_info['Python版本'], system_info['处理器']
+        )
     
     def _get_system_info(self) -> Dict[str, str]:
         """获取系统信息"""
-        try:
-            import platform
-            
-            info = {
-                '操作系统': platform.platform(),
-                'Python版本': platform.python_version(),
-                '处理器': platform.processor(),
-            }
-            
-            return info
-        except Exception as e:
-            self.logger.error(f"获取系统信息时发生错误: {str(e)}", exc_info=True)
-            return {
-                '操作系统': platform.platform(),
-                'Python版本': platform.python_version(),
-                '处理器': platform.processor(),
-            }
+        return _system_info()
     
     def _format_size(self, size: int) -> str:
         """格式化文件大小"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024:
-                return f"{size:.2f} {unit}"
-            size /= 1024
-        return f"{size:.2f} PB"
+        if size <= 0:
+            return "0.00 B"
+        # 由二进制位数直接确定单位（每 10 位为 1024 倍），无需逐级相除
+        index = min((int(size).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size / (1 << (index * 10)):.2f} {_SIZE_UNITS[index]}"
+    
+    def _periodic_flush(self) -> None:
+        """后台线程：每隔 LOG_FLUSH_INTERVAL 秒写出一次缓冲的日志，直到日志系统关闭"""
+        while not self._stop_event.wait(LOG_FLUSH_INTERVAL):
+            self.flush()
+    
+    def flush(self) -> None:
+        """把缓冲中的文件日志立即写入磁盘"""
+        self._memory_handler.flush()
+    
+    def close(self) -> None:
+        """停止后台日志线程，并写出队列及缓冲中剩余的日志"""
+        self._stop_event.set()
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        self.flush()
     
     def get_logger(self) -> logging.Logger:
         """
@@ -127,32 +337,35 @@ class LoggerManager:
         """
         return self.logger
     
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
         """
         记录调试信息
         
         Args:
-            message: 日志信息
+            message: 日志信息，可包含 % 格式占位符
+            *args: 格式化参数，仅在日志实际输出时才格式化
         """
-        self.logger.debug(message)
+        self.logger.debug(message, *args, stacklevel=2)
     
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args) -> None:
         """
         记录一般信息
         
         Args:
-            message: 日志信息
+            message: 日志信息，可包含 % 格式占位符
+            *args: 格式化参数，仅在日志实际输出时才格式化
         """
-        self.logger.info(message)
+        self.logger.info(message, *args, stacklevel=2)
     
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """
         记录警告信息
         
         Args:
-            message: 日志信息
+            message: 日志信息，可包含 % 格式占位符
+            *args: 格式化参数，仅在日志实际输出时才格式化
         """
-        self.logger.warning(message)
+        self.logger.warning(message, *args, stacklevel=2)
     
     def error(self, message: str, exc_info: bool = True) -> None:
         """
@@ -162,10 +375,8 @@ class LoggerManager:
             message: 日志信息
             exc_info: 是否包含异常信息
         """
-        if exc_info:
-            self.logger.error(f"{message}\n{traceback.format_exc()}")
-        else:
-            self.logger.error(message)
+        # 仅在确有正在处理的异常时附带堆栈，由 logging 在真正输出时再格式化
+        self.logger.error(message, exc_info=exc_info and sys.exc_info()[0] is not None, stacklevel=2)
     
     def critical(self, message: str, exc_info: bool = True) -> None:
         """
@@ -175,10 +386,8 @@ class LoggerManager:
             message: 日志信息
             exc_info: 是否包含异常信息
         """
-        if exc_info:
-            self.logger.critical(f"{message}\n{traceback.format_exc()}")
-        else:
-            self.logger.critical(message)
+        # 仅在确有正在处理的异常时附带堆栈，由 logging 在真正输出时再格式化
+        self.logger.critical(message, exc_info=exc_info and sys.exc_info()[0] is not None, stacklevel=2)
     
     def log_download_progress(self, url: str, progress: float, status: str) -> None:
         """
@@ -189,7 +398,8 @@ class LoggerManager:
             progress: 下载进度（0-100）
             status: 下载状态
         """
-        self.info(f"下载进度 - URL: {url}, 进度: {progress:.2f}%, 状态: {status}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("下载进度 - URL: %s, 进度: %.2f%%, 状态: %s", url, progress, status, stacklevel=2)
     
     def log_download_complete(self, url: str, output_path: str, duration: float) -> None:
         """
@@ -200,7 +410,12 @@ class LoggerManager:
             output_path: 输出文件路径
             duration: 下载耗时（秒）
         """
-        self.info(f"下载完成 - URL: {url}, 保存路径: {output_path}, 耗时: {duration:.2f}秒")
+        if self.logger.isEnabledFor(logging.INFO):
+            # 里程碑记录由后台日志线程连同之前缓冲的记录一起写入磁盘
+            self.logger.info(
+                "下载完成 - URL: %s, 保存路径: %s, 耗时: %.2f秒", url, output_path, duration,
+                stacklevel=2, extra={'flush': True}
+            )
     
     def log_update_progress(self, component: str, progress: float, status: str) -> None:
         """
@@ -211,7 +426,8 @@ class LoggerManager:
             progress: 更新进度（0-100）
             status: 更新状态
         """
-        self.info(f"更新进度 - 组件: {component}, 进度: {progress:.2f}%, 状态: {status}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("更新进度 - 组件: %s, 进度: %.2f%%, 状态: %s", component, progress, status, stacklevel=2)
     
     def log_update_complete(self, component: str, old_version: str, new_version: str) -> None:
         """
@@ -222,4 +438,9 @@ class LoggerManager:
             old_version: 旧版本
             new_version: 新版本
         """
-        self.info(f"更新完成 - 组件: {component}, 版本: {old_version} -> {new_version}")
+        if self.logger.isEnabledFor(logging.INFO):
+            # 里程碑记录由后台日志线程连同之前缓冲的记录一起写入磁盘
+            self.logger.info(
+                "更新完成 - 组件: %s, 版本: %s -> %s", component, old_version, new_version,
+                stacklevel=2, extra={'flush': True}
+            )
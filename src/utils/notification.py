@@ -4,10 +4,15 @@ YouTube Downloader 的通知管理模块
 """
 import os
 import sys
+import logging
 import tempfile
 from typing import Optional
 
 
+# 直接取用 LoggerManager 配置的同名记录器，导入本模块时不会触发日志系统初始化
+logger = logging.getLogger('youtube_downloader')
+
+
 class NotificationManager:
     """通知管理类"""
     
@@ -19,6 +24,15 @@ class NotificationManager:
         # Windows 通知相关
         self.win_notification_initialized = False
         self.win_notification_module = None
+        # winotify 的 Notification 类，初始化时导入一次
+        self._Notification = None
+        # 通知模块导入失败后不再重复尝试
+        self._init_failed = False
+        
+        # 默认图标路径只解析一次，不存在时为 None
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        default_icon = os.path.join(base_dir, 'resources', 'icons', 'app_icon.ico')
+        self._default_icon = default_icon if os.path.exists(default_icon) else None
     
     def _init_windows_notification(self) -> bool:
         """
@@ -33,6 +47,9 @@ class NotificationManager:
         if self.win_notification_initialized:
             return True
         
+        if self._init_failed:
+            return False
+        
         try:
             # 尝试导入 win10toast 模块
             from win10toast import ToastNotifier
@@ -43,10 +60,12 @@ class NotificationManager:
             try:
                 # 尝试导入 winotify 模块
                 from winotify import Notification
+                self._Notification = Notification
                 self.win_notification_module = "winotify"
                 self.win_notification_initialized = True
                 return True
             except ImportError:
+                self._init_failed = True
                 return False
     
     def show_download_complete_notification(self, title: str, output_dir: str, icon_path: Optional[str] = None) -> bool:
@@ -111,22 +130,14 @@ class NotificationManager:
             return False
         
         try:
-            # 使用默认图标
-            if icon_path is None or not os.path.exists(icon_path):
-                # 获取当前脚本所在目录
-                base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-                icon_path = os.path.join(base_dir, 'resources', 'icons', 'app_icon.ico')
-                
-                # 如果图标不存在，则使用临时文件
-                if not os.path.exists(icon_path):
-                    icon_path = None
+            # 未指定图标或图标不存在时使用默认图标
+            if not (icon_path and os.path.exists(icon_path)):
+                icon_path = self._default_icon
             
             # 根据不同的通知模块显示通知
             if self.win_notification_module == "winotify":
-                from winotify import Notification
-                
                 # 创建通知对象
-                notification = Notification(
+                notification = self._Notification(
                     app_id="YouTube 视频下载工具",
                     title=title,
                     msg=message,
@@ -150,5 +161,5 @@ class NotificationManager:
                     threaded=True
                 )
         except Exception as e:
-            print(f"显示通知时发生错误: {str(e)}")
+            logger.error("显示通知时发生错误: %s", e)
             return False
@@ -4,7 +4,9 @@ YouTube Downloader 跨平台工具模块
 """
 import os
 import sys
+import shutil
 import subprocess
+from functools import lru_cache
 from typing import List, Optional, Dict, Any, Union
 from pathlib import Path
 
@@ -16,7 +18,14 @@ IS_WINDOWS = os.name == 'nt'
 IS_MACOS = sys.platform == 'darwin'
 IS_LINUX = sys.platform.startswith('linux')
 
+# 所有子进程共用的基础参数（Windows 上不弹出控制台窗口）
+_BASE_SUBPROCESS_KW = {'creationflags': CREATE_NO_WINDOW} if IS_WINDOWS else {}
 
+# 以下目录/路径函数的结果在进程生命周期内不变，使用 lru_cache 缓存，
+# 需要创建目录的函数也只会在首次调用时访问文件系统
+
+
+@lru_cache(maxsize=None)
 def get_app_data_dir() -> Path:
     """
     获取应用程序数据目录
@@ -33,6 +42,7 @@ def get_app_data_dir() -> Path:
         return Path.home() / '.youtube_downloader'
 
 
+@lru_cache(maxsize=None)
 def get_logs_dir() -> Path:
     """
     获取日志目录
@@ -45,6 +55,7 @@ def get_logs_dir() -> Path:
     return logs_dir
 
 
+@lru_cache(maxsize=None)
 def get_cache_dir() -> Path:
     """
     获取缓存目录
@@ -57,6 +68,7 @@ def get_cache_dir() -> Path:
     return cache_dir
 
 
+@lru_cache(maxsize=None)
 def get_config_dir() -> Path:
     """
     获取配置目录
@@ -69,6 +81,7 @@ def get_config_dir() -> Path:
     return config_dir
 
 
+@lru_cache(maxsize=None)
 def get_project_root() -> Path:
     """
     获取项目根目录
@@ -82,6 +95,7 @@ def get_project_root() -> Path:
     return current.parent.parent.parent
 
 
+@lru_cache(maxsize=None)
 def get_binaries_dir() -> Path:
     """
     获取二进制文件目录
@@ -92,6 +106,7 @@ def get_binaries_dir() -> Path:
     return get_project_root() / 'resources' / 'binaries'
 
 
+@lru_cache(maxsize=None)
 def get_yt_dlp_path() -> Path:
     """
     获取 yt-dlp 可执行文件路径
@@ -103,6 +118,7 @@ def get_yt_dlp_path() -> Path:
     return get_binaries_dir() / 'yt-dlp' / exe_name
 
 
+@lru_cache(maxsize=None)
 def get_ffmpeg_path() -> Path:
     """
     获取 ffmpeg 可执行文件路径
@@ -114,6 +130,7 @@ def get_ffmpeg_path() -> Path:
     return get_binaries_dir() / 'ffmpeg' / exe_name
 
 
+@lru_cache(maxsize=None)
 def get_ffprobe_path() -> Path:
     """
     获取 ffprobe 可执行文件路径
@@ -125,6 +142,7 @@ def get_ffprobe_path() -> Path:
     return get_binaries_dir() / 'ffmpeg' / exe_name
 
 
+@lru_cache(maxsize=1)
 def find_javascript_runtime() -> Optional[str]:
     """
     检测系统中可用的 JavaScript 运行时
@@ -133,36 +151,14 @@ def find_javascript_runtime() -> Optional[str]:
     1. Node.js (node)
     2. Deno (deno)
     
+    只在 PATH 中查找可执行文件，不启动子进程，结果在进程内缓存
+    
     Returns:
         JavaScript 运行时名称（如 'node' 或 'deno'），如果未找到则返回 None
     """
-    # 尝试检测 Node.js
-    try:
-        result = run_subprocess(
-            ['node', '--version'],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=2.0
-        )
-        if result.returncode == 0:
-            return 'node'
-    except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-        pass
-    
-    # 尝试检测 Deno
-    try:
-        result = run_subprocess(
-            ['deno', '--version'],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=2.0
-        )
-        if result.returncode == 0:
-            return 'deno'
-    except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-        pass
+    for name in ('node', 'deno'):
+        if shutil.which(name):
+            return name
     
     return None
 
@@ -174,6 +170,7 @@ def get_js_runtime_args() -> List[str]:
     Returns:
         参数列表，如果找到运行时则返回 ['--js-runtimes', 'runtime']，否则返回空列表
     """
+    # 运行时检测结果已缓存，这里每次返回新列表，调用方可以放心修改
     runtime = find_javascript_runtime()
     if runtime:
         return ['--js-runtimes', runtime]
@@ -212,27 +209,22 @@ def run_subprocess(
         subprocess.CalledProcessError: 当 check=True 且返回码非零时
         subprocess.TimeoutExpired: 当超时时
     """
-    # 设置默认参数
-    default_kwargs = {
+    # 基础参数 + 用户提供的参数，可选参数仅在指定时传入
+    run_kwargs = {
+        **_BASE_SUBPROCESS_KW,
         'capture_output': capture_output,
         'text': text,
         'check': check,
-        'timeout': timeout,
-        'cwd': cwd,
-        'env': env,
+        **kwargs
     }
+    if timeout is not None:
+        run_kwargs['timeout'] = timeout
+    if cwd is not None:
+        run_kwargs['cwd'] = cwd
+    if env is not None:
+        run_kwargs['env'] = env
     
-    # Windows 特定：添加 CREATE_NO_WINDOW 标志
-    if IS_WINDOWS:
-        default_kwargs['creationflags'] = CREATE_NO_WINDOW
-    
-    # 合并用户提供的参数
-    default_kwargs.update(kwargs)
-    
-    # 移除 None 值
-    default_kwargs = {k: v for k, v in default_kwargs.items() if v is not None}
-    
-    return subprocess.run(cmd, **default_kwargs)
+    return subprocess.run(cmd, **run_kwargs)
 
 
 def run_subprocess_with_output(
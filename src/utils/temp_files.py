@@ -3,18 +3,88 @@ YouTube Downloader 临时文件管理模块
 统一管理临时文件的创建和清理
 """
 import os
+import errno
+import logging
 import tempfile
+import time
+import stat
 import shutil
 import atexit
+import itertools
 import threading
-from typing import Optional, List, Set
+from typing import Optional, Set, Tuple, Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime, timedelta
 
-from src.utils.platform import get_cache_dir
+from src.utils.platform import get_cache_dir, IS_WINDOWS
 from src.utils.logger import LoggerManager
 
 
+# 安全删除时每次覆写的块大小
+SECURE_DELETE_CHUNK_SIZE = 64 * 1024
+
+# 共享的零覆写块（只读，多线程共用无需额外分配）
+_ZERO_CHUNK = b'\x00' * SECURE_DELETE_CHUNK_SIZE
+
+# 快速创建临时文件时使用的打开标志（与 tempfile.mkstemp 一致）
+_FAST_MKSTEMP_FLAGS = (
+    os.O_RDWR | os.O_CREAT | os.O_EXCL
+    | getattr(os, 'O_NOFOLLOW', 0)
+    | getattr(os, 'O_CLOEXEC', 0)
+    | getattr(os, 'O_NOINHERIT', 0)
+    | getattr(os, 'O_BINARY', 0)
+)
+
+# Linux 匿名临时文件标志（其他平台为 0，表示不支持）
+_O_TMPFILE = getattr(os, 'O_TMPFILE', 0)
+
+# 后台清理旧临时文件的间隔（秒）
+OLD_FILES_CLEANUP_INTERVAL = 15 * 60
+
+# 临时文件总大小的缓存有效期（秒）
+SIZE_CACHE_TTL = 5.0
+
+
+def _is_reparse_point(st: os.stat_result) -> bool:
+    """判断 lstat 结果是否为 Windows 重解析点（符号链接、目录联接等）"""
+    return bool(getattr(st, 'st_file_attributes', 0) & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+def _fast_rmtree(path: str):
+    """
+    递归删除目录
+    
+    临时目录通常是扁平的，直接用 scandir + unlink + rmdir 删除，
+    省去 shutil.rmtree 对每个条目的额外检查和错误回调处理。
+    目录中的符号链接和 Windows 目录联接（junction）只删除链接本身，不会进入其指向的目录；
+    path 本身是链接时与 shutil.rmtree 一样拒绝删除。
+    
+    Args:
+        path: 目录路径
+        
+    Raises:
+        OSError: 删除失败或 path 是链接时（目录不存在时为 FileNotFoundError）
+    """
+    st = os.lstat(path)
+    if stat.S_ISLNK(st.st_mode) or _is_reparse_point(st):
+        raise OSError(f"不能递归删除链接: {path}")
+    _rmtree_entries(path)
+
+
+def _rmtree_entries(path: str):
+    """递归删除已确认不是链接的目录"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                os.unlink(entry.path)
+            elif IS_WINDOWS and _is_reparse_point(entry.stat(follow_symlinks=False)):
+                # 目录联接在 Windows 上也被视为目录，只删除联接本身
+                os.rmdir(entry.path)
+            else:
+                _rmtree_entries(entry.path)
+    os.rmdir(path)
+
+
 class TempFileManager:
     """
     临时文件管理器
@@ -24,44 +94,52 @@ class TempFileManager:
     - 自动清理
     - 跟踪所有临时文件
     - 安全删除选项
-    """
-    
-    _instance = None
-    _lock = threading.Lock()
     
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
+    全局只使用模块级实例 temp_manager，不要自行创建新的实例（测试中可指定独立的临时目录）
+    """
     
-    def __init__(self):
-        if self._initialized:
-            return
+    def __init__(self, temp_dir: Optional[str] = None):
+        """
+        初始化临时文件管理器
         
-        self._initialized = True
+        Args:
+            temp_dir: 应用临时目录，默认使用缓存目录下的 temp 子目录
+        """
         self.logger = LoggerManager().get_logger()
+        # 调试日志开关，关闭时热路径上不构造日志消息
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         
-        # 临时目录
-        self._temp_dir: Optional[str] = None
+        # 临时目录（进程内不变，只在初始化时创建一次）
+        self._temp_dir: str = str(temp_dir) if temp_dir else str(get_cache_dir() / 'temp')
+        os.makedirs(self._temp_dir, exist_ok=True)
         
-        # 跟踪的临时文件
+        # 跟踪的临时文件和目录
+        # 单次 add/discard 在 GIL 下是原子操作，无需加锁；锁只用于整体清理这类组合操作
         self._temp_files: Set[str] = set()
         self._temp_dirs: Set[str] = set()
         self._lock = threading.RLock()
         
+        # 快速创建临时文件时的文件名序号
+        self._counter = itertools.count()
+        
+        # 临时文件总大小缓存：(计算时间, 总大小)
+        self._size_cache: Optional[Tuple[float, int]] = None
+        
         # 注册退出清理
-        atexit.register(self.cleanup_all)
+        atexit.register(self._cleanup_at_exit)
+        
+        # 旧临时文件由后台线程定期清理，不占用退出时间
+        self._stop_event = threading.Event()
+        threading.Thread(
+            target=self._periodic_cleanup,
+            name='TempFileCleanup',
+            daemon=True
+        ).start()
         
         self.logger.info("临时文件管理器初始化完成")
     
     def _get_temp_dir(self) -> str:
         """获取临时目录"""
-        if self._temp_dir is None:
-            self._temp_dir = str(get_cache_dir() / 'temp')
-            os.makedirs(self._temp_dir, exist_ok=True)
         return self._temp_dir
     
     def create_temp_file(
@@ -83,22 +161,85 @@ class TempFileManager:
         Returns:
             临时文件路径
         """
-        temp_dir = dir or self._get_temp_dir()
-        
-        fd, temp_path = tempfile.mkstemp(
-            suffix=suffix,
-            prefix=prefix,
-            dir=temp_dir
-        )
+        if dir is None and prefix == 'ytdl_':
+            # 常见情况：在应用临时目录中创建默认前缀的文件
+            fd, temp_path = self._fast_mkstemp(suffix)
+        else:
+            fd, temp_path = tempfile.mkstemp(
+                suffix=suffix,
+                prefix=prefix,
+                dir=dir or self._get_temp_dir()
+            )
         os.close(fd)
         
         if delete_on_exit:
-            with self._lock:
-                self._temp_files.add(temp_path)
+            self._temp_files.add(temp_path)
         
-        self.logger.debug(f"创建临时文件: {temp_path}")
+        if self._debug_enabled:
+            self.logger.debug("创建临时文件: %s", temp_path)
         return temp_path
     
+    def _fast_mkstemp(self, suffix: str) -> Tuple[int, str]:
+        """
+        在应用临时目录中快速创建临时文件
+        
+        应用临时目录只由本程序使用，用“进程号 + 递增序号”生成文件名即可保证唯一，
+        只需一次 open 调用，省去 mkstemp 的随机名称生成和重试循环；
+        名称意外冲突时（如遗留了同进程号的旧文件）退回 mkstemp。
+        
+        Args:
+            suffix: 文件后缀
+            
+        Returns:
+            (文件描述符, 文件路径) 元组
+        """
+        temp_path = os.path.join(self._temp_dir, f"ytdl_{os.getpid()}_{next(self._counter)}{suffix}")
+        try:
+            return os.open(temp_path, _FAST_MKSTEMP_FLAGS, 0o600), temp_path
+        except FileExistsError:
+            return tempfile.mkstemp(suffix=suffix, prefix='ytdl_', dir=self._temp_dir)
+    
+    def create_anon_temp_file(self) -> int:
+        """
+        创建匿名临时文件
+        
+        使用 Linux 的 O_TMPFILE 在应用临时目录中创建没有目录项的文件，
+        描述符关闭后由内核自动回收，无需跟踪和清理。
+        
+        Returns:
+            文件描述符
+            
+        Raises:
+            OSError: 当前平台或文件系统不支持匿名临时文件时
+        """
+        if not _O_TMPFILE:
+            raise OSError(errno.EOPNOTSUPP, "当前平台不支持匿名临时文件")
+        return os.open(self._temp_dir, _O_TMPFILE | os.O_RDWR | os.O_CLOEXEC, 0o600)
+    
+    @contextmanager
+    def anon_file(self) -> Iterator[int]:
+        """
+        使用只需文件描述符的临时文件
+        
+        优先使用匿名临时文件；不支持时退回普通临时文件，退出时删除。
+        
+        Yields:
+            文件描述符
+        """
+        temp_path = None
+        try:
+            fd = self.create_anon_temp_file()
+        except OSError:
+            temp_path = self.create_temp_file()
+            fd = os.open(temp_path, os.O_RDWR | getattr(os, 'O_BINARY', 0))
+        
+        try:
+            yield fd
+        finally:
+            os.close(fd)
+            if temp_path is not None:
+                self.delete_file(temp_path)
+    
     def create_temp_dir(
         self,
         suffix: str = '',
@@ -127,10 +268,10 @@ class TempFileManager:
         )
         
         if delete_on_exit:
-            with self._lock:
-                self._temp_dirs.add(temp_path)
+            self._temp_dirs.add(temp_path)
         
-        self.logger.debug(f"创建临时目录: {temp_path}")
+        if self._debug_enabled:
+            self.logger.debug("创建临时目录: %s", temp_path)
         return temp_path
     
     def register_file(self, file_path: str):
@@ -140,8 +281,7 @@ class TempFileManager:
         Args:
             file_path: 文件路径
         """
-        with self._lock:
-            self._temp_files.add(file_path)
+        self._temp_files.add(file_path)
     
     def register_dir(self, dir_path: str):
         """
@@ -150,111 +290,225 @@ class TempFileManager:
         Args:
             dir_path: 目录路径
         """
-        with self._lock:
-            self._temp_dirs.add(dir_path)
+        self._temp_dirs.add(dir_path)
     
     def unregister_file(self, file_path: str):
         """取消注册文件"""
-        with self._lock:
-            self._temp_files.discard(file_path)
+        self._temp_files.discard(file_path)
     
     def unregister_dir(self, dir_path: str):
         """取消注册目录"""
-        with self._lock:
-            self._temp_dirs.discard(dir_path)
+        self._temp_dirs.discard(dir_path)
     
-    def delete_file(self, file_path: str, secure: bool = False) -> bool:
+    def delete_file(
+        self,
+        file_path: str,
+        secure: bool = False,
+        secure_random: bool = False,
+        durable: bool = False
+    ) -> bool:
         """
         删除临时文件
         
         Args:
             file_path: 文件路径
             secure: 是否安全删除（覆写后删除）
+            secure_random: 安全删除时是否用随机数据覆写（默认用零覆写）
+            durable: 安全删除时是否在删除前把覆写内容同步到磁盘
             
         Returns:
             是否成功删除
         """
         try:
-            if not os.path.exists(file_path):
+            # 直接删除，文件不存在时视为已删除（无需事先检查是否存在）
+            try:
+                if secure:
+                    self._secure_delete(file_path, secure_random, durable)
+                else:
+                    os.remove(file_path)
+            except FileNotFoundError:
                 self.unregister_file(file_path)
                 return True
             
-            if secure:
-                self._secure_delete(file_path)
-            else:
-                os.remove(file_path)
-            
             self.unregister_file(file_path)
-            self.logger.debug(f"删除临时文件: {file_path}")
+            if self._debug_enabled:
+                self.logger.debug("删除临时文件: %s", file_path)
             return True
         except Exception as e:
             self.logger.warning(f"删除临时文件失败: {file_path} - {e}")
             return False
     
-    def delete_dir(self, dir_path: str) -> bool:
+    def delete_dir(self, dir_path: str, symlink_safe: bool = False) -> bool:
         """
         删除临时目录
         
         Args:
             dir_path: 目录路径
+            symlink_safe: 是否使用 shutil.rmtree（可防御删除过程中目录被替换为符号链接的情况）
             
         Returns:
             是否成功删除
         """
         try:
-            if not os.path.exists(dir_path):
+            # 直接删除，目录不存在时视为已删除（无需事先检查是否存在）
+            try:
+                if symlink_safe:
+                    shutil.rmtree(dir_path)
+                else:
+                    _fast_rmtree(dir_path)
+            except FileNotFoundError:
                 self.unregister_dir(dir_path)
                 return True
             
-            shutil.rmtree(dir_path, ignore_errors=True)
             self.unregister_dir(dir_path)
-            self.logger.debug(f"删除临时目录: {dir_path}")
+            if self._debug_enabled:
+                self.logger.debug("删除临时目录: %s", dir_path)
             return True
         except Exception as e:
             self.logger.warning(f"删除临时目录失败: {dir_path} - {e}")
             return False
     
-    def _secure_delete(self, file_path: str):
+    def _secure_delete(self, file_path: str, secure_random: bool = False, durable: bool = False):
         """
         安全删除文件（覆写后删除）
         
+        默认不调用 fsync：文件随即被删除，覆写内容是否落盘对临时文件没有意义，
+        覆写仍能保证文件内容不会从页缓存中被读回。需要确保覆写落盘时传入 durable=True。
+        
         Args:
             file_path: 文件路径
+            secure_random: 是否用随机数据覆写（默认用零覆写，速度更快）
+            durable: 是否在删除前把覆写内容同步到磁盘
         """
         try:
             file_size = os.path.getsize(file_path)
             
-            # 用随机数据覆写
-            with open(file_path, 'wb') as f:
-                f.write(os.urandom(file_size))
-                f.flush()
-                os.fsync(f.fileno())
+            # 按固定大小的块原地覆写，内存占用与文件大小无关
+            zero_chunk = memoryview(_ZERO_CHUNK)
+            with open(file_path, 'r+b') as f:
+                remaining = file_size
+                while remaining > 0:
+                    n = min(remaining, SECURE_DELETE_CHUNK_SIZE)
+                    f.write(os.urandom(n) if secure_random else zero_chunk[:n])
+                    remaining -= n
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
             
             os.remove(file_path)
         except Exception:
             # 如果安全删除失败，尝试普通删除
             os.remove(file_path)
     
-    def cleanup_all(self):
-        """清理所有临时文件和目录"""
-        with self._lock:
-            # 清理文件
-            for file_path in list(self._temp_files):
-                self.delete_file(file_path)
+    def _cleanup_at_exit(self):
+        """
+        进程退出时的清理
+        
+        退出时不等待任何锁：宁可漏删个别临时文件，也不能让进程卡在退出阶段
+        """
+        self.stop_periodic_cleanup()
+        self.cleanup_all(blocking=False)
+    
+    def _periodic_cleanup(self):
+        """后台线程：启动时及之后每隔 OLD_FILES_CLEANUP_INTERVAL 秒清理一次旧临时文件"""
+        while True:
+            self._cleanup_old_files()
+            if self._stop_event.wait(OLD_FILES_CLEANUP_INTERVAL):
+                break
+    
+    def stop_periodic_cleanup(self):
+        """停止后台定期清理（立即唤醒并结束清理线程）"""
+        self._stop_event.set()
+    
+    def cleanup_all(self, blocking: bool = True):
+        """
+        清理所有临时文件和目录
+        
+        Args:
+            blocking: 是否等待管理器的锁；为 False 且锁被占用时仍直接清理（尽力而为）
+        """
+        acquired = self._lock.acquire(blocking=blocking)
+        try:
+            # 退出时应用临时目录中只有跟踪的路径时，整个目录一次删除后重建。
+            # 运行期间创建临时文件不加锁，检查之后新建的文件可能被一并删除，因此只在退出路径上这样做
+            if not blocking and self._covers_temp_dir():
+                removed_files = len(self._temp_files)
+                removed_dirs = len(self._temp_dirs)
+                self._temp_files.clear()
+                self._temp_dirs.clear()
+                shutil.rmtree(self._temp_dir, ignore_errors=True)
+                try:
+                    os.makedirs(self._temp_dir, exist_ok=True)
+                except OSError:
+                    pass
+                self.logger.info(f"临时文件清理完成: 删除 {removed_files} 个文件, {removed_dirs} 个目录")
+                return
             
-            # 清理目录
-            for dir_path in list(self._temp_dirs):
-                self.delete_dir(dir_path)
+            # 逐个弹出并删除（set.pop 是原子操作，无需复制整个集合；退出路径上不逐条记录日志）
+            removed_files = 0
+            while self._temp_files:
+                try:
+                    file_path = self._temp_files.pop()
+                except KeyError:
+                    break
+                try:
+                    os.unlink(file_path)
+                    removed_files += 1
+                except OSError:
+                    pass
             
-            # 清理主临时目录中的旧文件
-            self._cleanup_old_files()
+            # 嵌套的跟踪目录若已随父目录删除，rmtree 的 FileNotFoundError 会被忽略
+            removed_dirs = 0
+            while self._temp_dirs:
+                try:
+                    dir_path = self._temp_dirs.pop()
+                except KeyError:
+                    break
+                try:
+                    shutil.rmtree(dir_path)
+                    removed_dirs += 1
+                except OSError:
+                    pass
+        finally:
+            if acquired:
+                self._lock.release()
+        
+        self.logger.info(f"临时文件清理完成: 删除 {removed_files} 个文件, {removed_dirs} 个目录")
+    
+    def _covers_temp_dir(self) -> bool:
+        """
+        判断跟踪的路径是否恰好覆盖整个应用临时目录
+        
+        所有跟踪路径都位于应用临时目录下，且目录中的每一项都在跟踪之列时返回 True，
+        此时删除整个目录不会误删未跟踪的文件（如 delete_on_exit=False 创建的文件）。
+        直接在跟踪集合上检查，不复制集合。
+        
+        Returns:
+            是否可以直接删除整个临时目录
+        """
+        temp_files = self._temp_files
+        temp_dirs = self._temp_dirs
+        if not temp_files and not temp_dirs:
+            return False
         
-        self.logger.info("临时文件清理完成")
+        temp_dir = self._temp_dir
+        try:
+            for paths in (temp_files, temp_dirs):
+                if any(os.path.commonpath([temp_dir, path]) != temp_dir for path in paths):
+                    return False
+            with os.scandir(temp_dir) as entries:
+                return all(entry.path in temp_files or entry.path in temp_dirs for entry in entries)
+        except (OSError, ValueError, RuntimeError):
+            # RuntimeError: 检查期间集合被其他线程修改，退回逐个删除
+            return False
     
     def _cleanup_old_files(self, max_age_hours: int = 24):
         """
         清理旧的临时文件
         
+        运行期间会定期调用，因此跳过本进程仍在跟踪或由本进程创建的路径，
+        长时间运行时不会删除仍在使用的旧临时文件。
+        
         Args:
             max_age_hours: 最大保留时间（小时）
         """
@@ -262,51 +516,65 @@ class TempFileManager:
         if not os.path.exists(temp_dir):
             return
         
-        cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
+        cutoff_ts = time.time() - max_age_hours * 3600
+        own_prefix = f"ytdl_{os.getpid()}_"
+        temp_files = self._temp_files
+        temp_dirs = self._temp_dirs
         
         try:
-            for item in os.listdir(temp_dir):
-                item_path = os.path.join(temp_dir, item)
-                try:
-                    stat = os.stat(item_path)
-                    mtime = datetime.fromtimestamp(stat.st_mtime)
-                    
-                    if mtime < cutoff_time:
-                        if os.path.isfile(item_path):
-                            os.remove(item_path)
-                        elif os.path.isdir(item_path):
-                            shutil.rmtree(item_path, ignore_errors=True)
-                        self.logger.debug(f"清理旧临时文件: {item_path}")
-                except Exception:
-                    pass
+            # scandir 返回的目录项自带文件类型，stat 结果也会缓存，每个条目最多一次 stat
+            with os.scandir(temp_dir) as entries:
+                for entry in entries:
+                    try:
+                        if (entry.name.startswith(own_prefix)
+                                or entry.path in temp_files or entry.path in temp_dirs):
+                            continue
+                        if entry.stat(follow_symlinks=False).st_mtime >= cutoff_ts:
+                            continue
+                        
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path, ignore_errors=True)
+                        else:
+                            os.remove(entry.path)
+                        if self._debug_enabled:
+                            self.logger.debug("清理旧临时文件: %s", entry.path)
+                    except Exception:
+                        pass
         except Exception as e:
             self.logger.warning(f"清理旧临时文件时出错: {e}")
     
     def get_temp_file_count(self) -> int:
         """获取跟踪的临时文件数量"""
-        with self._lock:
-            return len(self._temp_files)
+        return len(self._temp_files)
     
     def get_temp_dir_count(self) -> int:
         """获取跟踪的临时目录数量"""
-        with self._lock:
-            return len(self._temp_dirs)
+        return len(self._temp_dirs)
     
     def get_temp_size(self) -> int:
         """
-        获取临时文件总大小
+        获取临时文件总大小（结果缓存 SIZE_CACHE_TTL 秒）
         
         Returns:
             总大小（字节）
         """
-        total_size = 0
+        now = time.monotonic()
+        cached = self._size_cache
+        if cached is not None and now - cached[0] < SIZE_CACHE_TTL:
+            return cached[1]
+        
+        # 只在锁内复制路径列表，stat 在锁外进行，不阻塞临时文件的创建
         with self._lock:
-            for file_path in self._temp_files:
-                try:
-                    if os.path.exists(file_path):
-                        total_size += os.path.getsize(file_path)
-                except Exception:
-                    pass
+            file_paths = list(self._temp_files)
+        
+        total_size = 0
+        for file_path in file_paths:
+            try:
+                total_size += os.stat(file_path).st_size
+            except OSError:
+                pass
+        
+        self._size_cache = (now, total_size)
         return total_size
     
     def get_statistics(self) -> dict:
@@ -319,7 +587,7 @@ class TempFileManager:
         }
 
 
-# 全局实例
+# 全局实例（模块导入时创建一次）
 temp_manager = TempFileManager()
 
 
@@ -334,9 +602,9 @@ def create_temp_dir(**kwargs) -> str:
     return temp_manager.create_temp_dir(**kwargs)
 
 
-def delete_temp_file(file_path: str, secure: bool = False) -> bool:
+def delete_temp_file(file_path: str, secure: bool = False, secure_random: bool = False) -> bool:
     """删除临时文件"""
-    return temp_manager.delete_file(file_path, secure)
+    return temp_manager.delete_file(file_path, secure, secure_random)
 
 
 def cleanup_temp_files():
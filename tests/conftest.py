@@ -7,16 +7,27 @@ import pytest
 import tempfile
 import shutil
 from pathlib import Path
+from types import MappingProxyType
 
-# 添加项目根目录到路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# 添加项目根目录到路径（各测试模块无需再自行设置）
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ROOT = str(PROJECT_ROOT)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def pytest_configure(config):
+    """注册自定义标记（未安装 pytest-xdist 时避免未知标记警告）"""
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): 使用 pytest-xdist --dist loadgroup 时，同组测试分配到同一个 worker"
+    )
 
 
 @pytest.fixture(scope="session")
 def project_root():
     """获取项目根目录"""
-    return Path(__file__).parent.parent
+    return PROJECT_ROOT
 
 
 @pytest.fixture
@@ -40,10 +51,10 @@ def temp_file(temp_dir):
         os.remove(temp_path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_video_info():
-    """示例视频信息"""
-    return {
+    """示例视频信息（整个测试会话共享，只读）"""
+    return MappingProxyType({
         'id': 'dQw4w9WgXcQ',
         'title': 'Test Video Title',
         'description': 'Test description',
@@ -55,8 +66,8 @@ def sample_video_info():
         'like_count': 50000,
         'thumbnail': 'https://example.com/thumb.jpg',
         'is_live': False,
-        'formats': [
-            {
+        'formats': (
+            MappingProxyType({
                 'format_id': '137',
                 'ext': 'mp4',
                 'width': 1920,
@@ -65,17 +76,17 @@ def sample_video_info():
                 'vcodec': 'avc1',
                 'acodec': 'none',
                 'filesize': 100000000
-            },
-            {
+            }),
+            MappingProxyType({
                 'format_id': '140',
                 'ext': 'm4a',
                 'vcodec': 'none',
                 'acodec': 'mp4a',
                 'abr': 128,
                 'filesize': 5000000
-            }
-        ]
-    }
+            })
+        )
+    })
 
 
 @pytest.fixture
@@ -0,0 +1,58 @@
+"""
+配置管理模块测试
+"""
+import os
+import json
+
+
+class TestConfigManager:
+    """配置管理器测试"""
+
+    def test_defaults_without_config_file(self, tmp_path):
+        """测试没有配置文件时使用默认配置"""
+        from src.utils.config import ConfigManager
+
+        config = ConfigManager(config_file=str(tmp_path / 'config.json'))
+
+        assert config.get('proxy_port') == 7890
+        assert config.get('proxy_password') == ''
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        """测试保存后重新加载得到相同的配置"""
+        from src.utils.config import ConfigManager
+
+        config_file = str(tmp_path / 'config.json')
+        config = ConfigManager(config_file=config_file)
+        config.update({'proxy_enabled': True, 'proxy_password': '密码', 'download_dir': '/tmp/下载'})
+
+        assert config.save_config() is True
+        assert os.path.exists(config_file + '.gz')
+        assert not os.path.exists(config_file + '.gz.tmp')
+
+        reloaded = ConfigManager(config_file=config_file)
+        assert reloaded.get('proxy_enabled') is True
+        assert reloaded.get('proxy_password') == '密码'
+        assert reloaded.get('download_dir') == '/tmp/下载'
+
+    def test_migrates_legacy_json(self, tmp_path):
+        """测试读取旧版纯 JSON 配置，保存后删除旧文件"""
+        from src.utils.config import ConfigManager
+
+        config_file = tmp_path / 'config.json'
+        config_file.write_text(
+            json.dumps({'proxy_password': 'old-secret', 'prefer_mp4': False}),
+            encoding='utf-8'
+        )
+
+        config = ConfigManager(config_file=str(config_file))
+        assert config.get('proxy_password') == 'old-secret'
+        assert config.get('prefer_mp4') is False
+
+        config.set('proxy_password', '')
+        assert config.save_config() is True
+
+        # 旧文件中的密码不再留在磁盘上
+        assert not config_file.exists()
+        reloaded = ConfigManager(config_file=str(config_file))
+        assert reloaded.get('proxy_password') == ''
+        assert reloaded.get('prefer_mp4') is False
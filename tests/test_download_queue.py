@@ -4,11 +4,6 @@
 import pytest
 import time
 import threading
-import os
-import sys
-
-# 添加项目根目录到路径
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.types import DownloadOptions, DownloadPriority, DownloadStatus
 
@@ -0,0 +1,102 @@
+"""
+错误提示模块测试
+"""
+import pytest
+
+
+class TestErrorMessages:
+    """错误消息测试"""
+    
+    def test_known_pattern(self):
+        """测试已知错误模式"""
+        from src.utils.error_messages import ErrorMessages
+        
+        message = ErrorMessages.get_user_message("ERROR: [youtube] abc: Video unavailable")
+        
+        assert message.startswith("视频不可用")
+        assert "💡 建议" in message
+    
+    def test_case_insensitive(self):
+        """测试大小写不敏感匹配"""
+        from src.utils.error_messages import ErrorMessages
+        
+        assert ErrorMessages.get_error_title("http error 429: too many requests") == "请求过于频繁"
+    
+    def test_pattern_priority(self):
+        """测试多个模式同时命中时按定义顺序优先"""
+        from src.utils.error_messages import ErrorMessages
+        
+        # 'yt-dlp' 出现在前面，但 'Sign in to confirm your age' 的优先级更高
+        error = "yt-dlp: ERROR: Sign in to confirm your age"
+        
+        assert ErrorMessages.get_error_title(error) == "年龄限制"
+    
+    def test_no_pattern_is_prefix_of_another(self):
+        """测试没有错误模式是另一个模式的前缀（合并正则的分支顺序才不影响命中结果）"""
+        from src.utils.error_messages import ErrorMessages
+        
+        patterns = [pattern_lower for pattern_lower, _, _ in ErrorMessages._PATTERNS_LOWER]
+        
+        for pattern in patterns:
+            for other in patterns:
+                assert other == pattern or not other.startswith(pattern), (pattern, other)
+    
+    def test_common_patterns_exist(self):
+        """测试优先尝试的常见模式都是现有的错误模式"""
+        from src.utils.error_messages import ErrorMessages, _COMMON_PATTERNS
+        
+        assert set(_COMMON_PATTERNS) <= ErrorMessages._PATTERN_INDEX.keys()
+        assert ErrorMessages._LEADING_PATTERNS == _COMMON_PATTERNS
+    
+    def test_unknown_error(self):
+        """测试未知错误"""
+        from src.utils.error_messages import ErrorMessages
+        
+        message = ErrorMessages.get_user_message("something odd happened")
+        
+        assert message.startswith("下载出错")
+        assert "something odd happened" in message
+        assert ErrorMessages.get_error_title("something odd happened") == "下载出错"
+    
+    def test_without_suggestion(self):
+        """测试不包含建议"""
+        from src.utils.error_messages import ErrorMessages
+        
+        message = ErrorMessages.get_user_message("No space left on device", include_suggestion=False)
+        
+        assert message.startswith("磁盘空间不足")
+        assert "💡 建议" not in message
+    
+    def test_is_recoverable(self):
+        """测试可恢复错误判断"""
+        from src.utils.error_messages import ErrorMessages
+        
+        assert ErrorMessages.is_recoverable("Connection reset by peer")
+        assert not ErrorMessages.is_recoverable("Video unavailable")
+    
+    def test_needs_cookie(self):
+        """测试需要 Cookie 判断"""
+        from src.utils.error_messages import ErrorMessages
+        
+        assert ErrorMessages.needs_cookie("Sign in to confirm you're not a bot")
+        assert not ErrorMessages.needs_cookie("Connection refused")
+    
+    def test_classify(self):
+        """测试一次性错误分类"""
+        from src.utils.error_messages import ErrorMessages
+        
+        classified = ErrorMessages.classify("ERROR: This video is private")
+        
+        assert classified.matched
+        assert classified.title == "私人视频"
+        assert classified.needs_cookie
+        assert not classified.recoverable
+        assert classified.format() == ErrorMessages.get_user_message("ERROR: This video is private")
+    
+    def test_from_exception(self):
+        """测试从异常获取消息"""
+        from src.utils.error_messages import ErrorMessages
+        from src.core.exceptions import NetworkError
+        
+        assert ErrorMessages.from_exception(NetworkError("boom")).startswith("网络错误")
+        assert ErrorMessages.from_exception(ValueError("HTTP Error 429")).startswith("请求过于频繁")
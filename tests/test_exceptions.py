@@ -2,11 +2,6 @@
 异常模块测试
 """
 import pytest
-import os
-import sys
-
-# 添加项目根目录到路径
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 class TestExceptions:
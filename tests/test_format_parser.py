@@ -2,79 +2,78 @@
 格式解析器测试
 """
 import pytest
-import os
-import sys
+from collections import namedtuple
 
-# 添加项目根目录到路径
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.core.video_info.format_parser import FormatParser
+
+
+# 解析结果在测试中只读访问，转换为具名元组按属性读取
+Format = namedtuple('Format', [
+    'format_id', 'type', 'resolution', 'fps', 'vcodec', 'acodec',
+    'abr', 'vbr', 'asr', 'filesize', 'protocol', 'has_audio', 'format_note'
+])
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """模块内共享的格式解析器"""
+    return FormatParser()
+
+
+@pytest.fixture(scope="module")
+def available_formats(parser, sample_video_info):
+    """示例视频信息解析出的可用格式（模块内只解析一次）"""
+    return tuple(Format(**fmt) for fmt in parser.get_available_formats(sample_video_info))
+
+
+@pytest.fixture(scope="module")
+def formats_by_type(available_formats):
+    """按类型（video/audio）分组的可用格式"""
+    groups = {}
+    for fmt in available_formats:
+        groups.setdefault(fmt.type, []).append(fmt)
+    return groups
 
 
 class TestFormatParser:
     """格式解析器测试"""
     
-    def test_get_available_formats(self, sample_video_info):
+    @pytest.mark.xdist_group(name="format_parser")
+    def test_get_available_formats(self, available_formats):
         """测试获取可用格式"""
-        from src.core.video_info.format_parser import FormatParser
-        
-        parser = FormatParser()
-        formats = parser.get_available_formats(sample_video_info)
-        
-        assert len(formats) > 0
+        assert len(available_formats) > 0
     
-    def test_filter_video_formats(self, sample_video_info):
+    @pytest.mark.xdist_group(name="format_parser")
+    def test_filter_video_formats(self, formats_by_type):
         """测试过滤视频格式"""
-        from src.core.video_info.format_parser import FormatParser
-        
-        parser = FormatParser()
-        formats = parser.get_available_formats(sample_video_info)
-        
-        video_formats = [f for f in formats if f.get('type') == 'video']
-        assert len(video_formats) > 0
+        assert formats_by_type.get('video')
     
-    def test_filter_audio_formats(self, sample_video_info):
+    @pytest.mark.xdist_group(name="format_parser")
+    def test_filter_audio_formats(self, formats_by_type):
         """测试过滤音频格式"""
-        from src.core.video_info.format_parser import FormatParser
-        
-        parser = FormatParser()
-        formats = parser.get_available_formats(sample_video_info)
-        
-        audio_formats = [f for f in formats if f.get('type') == 'audio']
-        assert len(audio_formats) > 0
+        assert formats_by_type.get('audio')
     
-    def test_format_resolution(self):
+    @pytest.mark.parametrize("width,height,expected", [
+        (1920, 1080, "1920x1080"),
+        (1280, 720, "1280x720"),
+    ])
+    def test_format_resolution(self, parser, width, height, expected):
         """测试格式化分辨率"""
-        from src.core.video_info.format_parser import FormatParser
-        
-        parser = FormatParser()
-        
-        assert parser.format_resolution(1920, 1080) == "1920x1080"
-        assert parser.format_resolution(1280, 720) == "1280x720"
+        assert parser.format_resolution(width, height) == expected
     
-    def test_format_filesize(self):
+    @pytest.mark.parametrize("size,expected", [
+        (1024, "1.00 KB"),
+        (1024 * 1024, "1.00 MB"),
+        (1024 * 1024 * 1024, "1.00 GB"),
+    ])
+    def test_format_filesize(self, parser, size, expected):
         """测试格式化文件大小"""
-        from src.core.video_info.format_parser import FormatParser
-        
-        parser = FormatParser()
-        
-        assert parser.format_filesize(1024) == "1.00 KB"
-        assert parser.format_filesize(1024 * 1024) == "1.00 MB"
-        assert parser.format_filesize(1024 * 1024 * 1024) == "1.00 GB"
-    
-    def test_empty_video_info(self):
-        """测试空视频信息"""
-        from src.core.video_info.format_parser import FormatParser
-        
-        parser = FormatParser()
-        formats = parser.get_available_formats({})
-        
-        assert formats == []
+        assert parser.format_filesize(size) == expected
     
-    def test_none_video_info(self):
-        """测试 None 视频信息"""
-        from src.core.video_info.format_parser import FormatParser
-        
-        parser = FormatParser()
-        formats = parser.get_available_formats(None)
+    @pytest.mark.parametrize("video_info", [{}, None, [], 0, ""])
+    def test_empty_video_info(self, parser, video_info):
+        """测试空视频信息（空字典、None 等假值）"""
+        formats = parser.get_available_formats(video_info)
         
         assert formats == []
 
@@ -82,25 +81,10 @@ class TestFormatParser:
 class TestCodecMapping:
     """编码映射测试"""
     
-    def test_video_codec_name(self):
-        """测试视频编码名称"""
-        from src.core.video_info.format_parser import FormatParser
-        
-        parser = FormatParser()
-        
-        # 检查编码映射是否存在
-        if parser.codec_mappings.get('video_codecs'):
-            avc = parser.codec_mappings['video_codecs'].get('avc1', {})
-            assert 'name' in avc or avc == {}
-    
-    def test_audio_codec_name(self):
-        """测试音频编码名称"""
-        from src.core.video_info.format_parser import FormatParser
-        
-        parser = FormatParser()
-        
-        # 检查编码映射是否存在
-        if parser.codec_mappings.get('audio_codecs'):
-            mp4a = parser.codec_mappings['audio_codecs'].get('mp4a', {})
-            assert 'name' in mp4a or mp4a == {}
-
+    @pytest.mark.parametrize("group,key,expected", [
+        ("video_codecs", "avc1", "H.264"),
+        ("audio_codecs", "mp4a", "AAC"),
+    ])
+    def test_codec_name(self, parser, group, key, expected):
+        """测试编码名称映射（映射表中编码标识对应显示名称字符串）"""
+        assert parser.codec_mappings.get(group, {}).get(key) == expected
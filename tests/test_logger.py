@@ -0,0 +1,141 @@
+"""
+日志管理模块测试
+"""
+import pytest
+import time
+import atexit
+import logging
+import threading
+
+
+@pytest.fixture
+def logger_manager(tmp_path, monkeypatch):
+    """创建写入临时目录的日志管理器，测试结束后关闭并重置单例"""
+    from src.utils import logger as logger_module
+
+    # 拉长定时写出间隔，确保测试中看到的内容不是定时写出线程写出的
+    monkeypatch.setattr(logger_module, 'LOG_FLUSH_INTERVAL', 60.0)
+    monkeypatch.setattr(logger_module.LoggerManager, '_instance', None)
+    monkeypatch.setattr(logger_module.LoggerManager, '_initialized', False)
+
+    # 全局日志记录器在测试间共享，保存原有处理器和级别，结束后恢复
+    shared_logger = logging.getLogger('youtube_downloader')
+    original_handlers = list(shared_logger.handlers)
+    original_level = shared_logger.level
+
+    manager = logger_module.LoggerManager(log_file=str(tmp_path / 'test.log'))
+    yield manager
+    manager.close()
+    atexit.unregister(manager.close)
+    for handler in shared_logger.handlers:
+        handler.close()
+    manager._memory_handler.target.close()
+    shared_logger.handlers[:] = original_handlers
+    shared_logger.setLevel(original_level)
+
+
+def _wait_for_text(path, text, timeout=2.0):
+    """等待后台日志线程把指定内容写入文件"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if path.exists() and text in path.read_text(encoding='utf-8'):
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestLoggerManager:
+    """日志管理器测试"""
+
+    def test_download_complete_written_to_file(self, logger_manager, tmp_path):
+        """测试下载完成记录无需等待缓冲攒满或定时器即写入磁盘"""
+        log_path = tmp_path / 'test.log'
+
+        logger_manager.info("普通记录")
+        logger_manager.log_download_complete('https://example.com/v', '/tmp/v.mp4', 1.5)
+
+        assert _wait_for_text(log_path, "下载完成 - URL: https://example.com/v")
+        # 之前缓冲的记录一起写出
+        assert "普通记录" in log_path.read_text(encoding='utf-8')
+
+    def test_milestone_flush_off_calling_thread(self, logger_manager, tmp_path, monkeypatch):
+        """测试里程碑记录的磁盘写出在后台日志线程上进行，不阻塞调用线程"""
+        handler = logger_manager._memory_handler
+        flush_threads = []
+        original_flush = handler.flush
+
+        def recording_flush():
+            flush_threads.append(threading.current_thread())
+            original_flush()
+
+        monkeypatch.setattr(handler, 'flush', recording_flush)
+
+        logger_manager.log_download_complete('https://example.com/v', '/tmp/v.mp4', 1.5)
+
+        assert _wait_for_text(tmp_path / 'test.log', "下载完成")
+        assert flush_threads
+        assert threading.current_thread() not in flush_threads
+
+    def test_traceback_formatted_off_calling_thread(self, logger_manager, tmp_path, monkeypatch):
+        """测试异常堆栈在后台日志线程上格式化"""
+        format_threads = []
+        original_format_exception = logging.Formatter.formatException
+
+        def recording_format_exception(formatter, exc_info):
+            format_threads.append(threading.current_thread())
+            return original_format_exception(formatter, exc_info)
+
+        monkeypatch.setattr(logging.Formatter, 'formatException', recording_format_exception)
+        # 不传给 pytest 挂在根记录器上的捕获处理器（它在调用线程上格式化）
+        monkeypatch.setattr(logger_manager.logger, 'propagate', False)
+
+        try:
+            raise ValueError("测试异常")
+        except ValueError:
+            logger_manager.error("处理失败")
+
+        assert _wait_for_text(tmp_path / 'test.log', "ValueError: 测试异常")
+        assert format_threads
+        assert threading.current_thread() not in format_threads
+
+    def test_periodic_flush_thread_stops_on_close(self, logger_manager):
+        """测试定时写出由单个后台线程完成，关闭后线程退出"""
+        flush_thread = logger_manager._flush_thread
+        assert flush_thread.is_alive()
+
+        logger_manager.close()
+
+        flush_thread.join(timeout=2.0)
+        assert not flush_thread.is_alive()
+
+    def test_update_complete_written_to_file(self, logger_manager, tmp_path):
+        """测试更新完成记录立即写入磁盘"""
+        logger_manager.log_update_complete('yt-dlp', '2024.01.01', '2024.02.01')
+
+        assert _wait_for_text(tmp_path / 'test.log', "更新完成 - 组件: yt-dlp")
+
+    def test_plain_records_stay_buffered(self, logger_manager, tmp_path):
+        """测试普通记录留在内存缓冲中"""
+        logger_manager.info("仅缓冲")
+
+        assert not _wait_for_text(tmp_path / 'test.log', "仅缓冲", timeout=0.2)
+
+        logger_manager.close()
+        assert "仅缓冲" in (tmp_path / 'test.log').read_text(encoding='utf-8')
+
+
+class TestCachedSizeRotatingHandler:
+    """滚动文件处理器测试"""
+
+    def test_tracked_size_matches_file(self, tmp_path):
+        """测试累计的大小与磁盘上的文件大小一致（含多行消息）"""
+        from src.utils.logger import CachedSizeRotatingHandler
+
+        log_path = tmp_path / 'size.log'
+        handler = CachedSizeRotatingHandler(str(log_path), maxBytes=1024 * 1024, encoding='utf-8', delay=True)
+        try:
+            for msg in ("单行记录", "多行记录\n第二行\n第三行"):
+                handler.emit(logging.makeLogRecord({'msg': msg, 'levelno': logging.INFO}))
+            assert handler._current_size == log_path.stat().st_size
+        finally:
+            handler.close()
@@ -0,0 +1,180 @@
+"""
+临时文件管理模块测试
+"""
+import pytest
+import os
+import time
+import atexit
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """创建使用独立临时目录的管理器，测试结束后停止后台清理线程"""
+    from src.utils.temp_files import TempFileManager
+    
+    temp_manager = TempFileManager(temp_dir=str(tmp_path / 'temp'))
+    yield temp_manager
+    temp_manager.stop_periodic_cleanup()
+    atexit.unregister(temp_manager._cleanup_at_exit)
+
+
+class TestTempFileManager:
+    """临时文件管理器测试"""
+    
+    def test_create_and_delete_file(self, manager, tmp_path):
+        """测试创建和删除临时文件"""
+        file_path = manager.create_temp_file(suffix='.txt', dir=str(tmp_path))
+        
+        assert os.path.exists(file_path)
+        assert os.path.basename(file_path).startswith('ytdl_')
+        assert file_path.endswith('.txt')
+        
+        assert manager.delete_file(file_path) is True
+        assert not os.path.exists(file_path)
+        # 重复删除视为成功
+        assert manager.delete_file(file_path) is True
+    
+    def test_create_and_delete_dir(self, manager, tmp_path):
+        """测试创建和删除临时目录"""
+        dir_path = manager.create_temp_dir(dir=str(tmp_path))
+        with open(os.path.join(dir_path, 'data.bin'), 'wb') as f:
+            f.write(b'data')
+        os.makedirs(os.path.join(dir_path, 'sub', 'nested'))
+        with open(os.path.join(dir_path, 'sub', 'nested', 'data.bin'), 'wb') as f:
+            f.write(b'data')
+        
+        assert manager.delete_dir(dir_path) is True
+        assert not os.path.exists(dir_path)
+        # 重复删除视为成功
+        assert manager.delete_dir(dir_path) is True
+    
+    def test_delete_dir_keeps_link_targets(self, manager, tmp_path):
+        """测试删除目录时只删除其中的链接，不删除链接指向的内容"""
+        target = tmp_path / 'target'
+        target.mkdir()
+        (target / 'keep.bin').write_bytes(b'data')
+        
+        dir_path = manager.create_temp_dir(dir=str(tmp_path))
+        try:
+            os.symlink(str(target), os.path.join(dir_path, 'link'), target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("当前环境不能创建符号链接")
+        
+        assert manager.delete_dir(dir_path) is True
+        assert not os.path.exists(dir_path)
+        assert (target / 'keep.bin').exists()
+        
+        # 目录本身是链接时拒绝删除
+        link = tmp_path / 'dir_link'
+        os.symlink(str(target), str(link), target_is_directory=True)
+        assert manager.delete_dir(str(link)) is False
+        assert (target / 'keep.bin').exists()
+    
+    def test_delete_recreated_file(self, manager, tmp_path):
+        """测试删除后在同一路径重新出现的文件仍会被删除"""
+        file_path = str(tmp_path / 'ytdl_recreated.part')
+        # 文件不存在时视为已删除
+        assert manager.delete_file(file_path) is True
+        
+        with open(file_path, 'wb') as f:
+            f.write(b'data')
+        
+        assert manager.delete_file(file_path) is True
+        assert not os.path.exists(file_path)
+    
+    def test_delete_recreated_dir(self, manager, tmp_path):
+        """测试删除后在同一路径重新出现的目录仍会被删除"""
+        dir_path = manager.create_temp_dir(dir=str(tmp_path))
+        assert manager.delete_dir(dir_path) is True
+        assert manager.delete_dir(dir_path) is True
+        
+        os.makedirs(os.path.join(dir_path, 'sub'))
+        
+        assert manager.delete_dir(dir_path) is True
+        assert not os.path.exists(dir_path)
+    
+    @pytest.mark.parametrize('secure_random', [False, True])
+    def test_secure_delete(self, manager, tmp_path, secure_random):
+        """测试安全删除（大于一个覆写块的文件）"""
+        from src.utils.temp_files import SECURE_DELETE_CHUNK_SIZE
+        
+        file_path = manager.create_temp_file(dir=str(tmp_path))
+        with open(file_path, 'wb') as f:
+            f.write(b'x' * (SECURE_DELETE_CHUNK_SIZE * 2 + 100))
+        
+        assert manager.delete_file(file_path, secure=True, secure_random=secure_random) is True
+        assert not os.path.exists(file_path)
+    
+    def test_fast_create_in_managed_dir(self, manager):
+        """测试在应用临时目录中快速创建文件"""
+        paths = [manager.create_temp_file(suffix='.part') for _ in range(3)]
+        
+        try:
+            assert len(set(paths)) == 3
+            for path in paths:
+                assert os.path.dirname(path) == manager._get_temp_dir()
+                assert os.path.basename(path).startswith(f'ytdl_{os.getpid()}_')
+                assert path.endswith('.part')
+                assert os.path.exists(path)
+        finally:
+            for path in paths:
+                manager.delete_file(path)
+    
+    def test_anon_file(self, manager):
+        """测试匿名临时文件"""
+        count = manager.get_temp_file_count()
+        
+        with manager.anon_file() as fd:
+            os.write(fd, b'hello')
+            os.lseek(fd, 0, os.SEEK_SET)
+            assert os.read(fd, 5) == b'hello'
+        
+        assert manager.get_temp_file_count() == count
+    
+    def test_cleanup_all_keeps_files_created_during_cleanup(self, manager, monkeypatch):
+        """测试运行期间的清理不会删除检查之后新建的未跟踪文件"""
+        tracked = manager.create_temp_file()
+        # 模拟其他线程正在创建、尚未加入跟踪集合的文件
+        in_flight = os.path.join(manager._get_temp_dir(), 'ytdl_in_flight.part')
+        with open(in_flight, 'wb') as f:
+            f.write(b'data')
+        monkeypatch.setattr(manager, '_covers_temp_dir', lambda: True)
+        
+        manager.cleanup_all()
+        
+        assert not os.path.exists(tracked)
+        assert os.path.exists(in_flight)
+    
+    def test_cleanup_all_at_exit_removes_temp_dir_contents(self, manager):
+        """测试退出清理在只有跟踪路径时删除整个临时目录的内容"""
+        file_path = manager.create_temp_file()
+        dir_path = manager.create_temp_dir()
+        
+        manager.cleanup_all(blocking=False)
+        
+        assert not os.path.exists(file_path)
+        assert not os.path.exists(dir_path)
+        assert os.path.isdir(manager._get_temp_dir())
+        assert manager.get_temp_file_count() == 0
+        assert manager.get_temp_dir_count() == 0
+    
+    def test_cleanup_old_files_keeps_tracked_paths(self, manager):
+        """测试定期清理跳过本进程仍在跟踪的旧临时文件和目录，只删除其他旧文件"""
+        old_ts = time.time() - 48 * 3600
+        
+        tracked_file = manager.create_temp_file()
+        # 通过 mkstemp 创建（文件名不带本进程前缀），只靠跟踪集合保护
+        tracked_other = manager.create_temp_file(prefix='dl_')
+        tracked_dir = manager.create_temp_dir()
+        stale = os.path.join(manager._get_temp_dir(), 'ytdl_stale.part')
+        with open(stale, 'wb') as f:
+            f.write(b'data')
+        for path in (tracked_file, tracked_other, tracked_dir, stale):
+            os.utime(path, (old_ts, old_ts))
+        
+        manager._cleanup_old_files()
+        
+        assert os.path.exists(tracked_file)
+        assert os.path.exists(tracked_other)
+        assert os.path.isdir(tracked_dir)
+        assert not os.path.exists(stale)